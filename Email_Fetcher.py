@@ -2,8 +2,10 @@ import os
 import re
 import json
 import pandas as pd
+import numpy as np
 import time
 import shutil
+from functools import lru_cache
 from datetime import datetime, timedelta
 from imap_tools import MailBox, AND, OR, A
 
@@ -45,6 +47,30 @@ def clean_price(price_str):
     except ValueError:
         return None
 
+
+def clean_price_series(prices):
+    """
+    Vectorized clean_price for a whole column. E.g., ['13 000 kr', 12500] -> [13000, 12500]
+    
+    Strips 'kr' and whitespace (including non-breaking spaces) with one regex pass and
+    parses the result in pandas' C kernels instead of a Python call per row. Decimal
+    strings (e.g. '13000.0' read back from an earlier CSV) are truncated like
+    int(float(...)).
+    
+    Args:
+        prices: pandas Series of price values (strings like '13 000 kr', numbers, or NaN)
+    
+    Returns:
+        pd.Series: Nullable Int64 series; 'unknown' and unparseable values become <NA>
+    """
+    price_numeric = pd.to_numeric(
+        prices.astype('string').str.replace(r'kr|\s', '', regex=True),
+        errors='coerce'
+    )
+    # 'inf'/'nan' strings parse as floats but aren't prices
+    price_numeric = price_numeric.where(np.isfinite(price_numeric))
+    return np.trunc(price_numeric).astype('Int64')
+
 # ============================================
 # PROCESSED EMAILS TRACKING
 # ============================================
@@ -298,6 +324,12 @@ def decode_finn_tracking_url(tracking_url):
         return tracking_url
 
 
+# Finnkode patterns, compiled once (extract_finnkode runs for every link on every load)
+FINNKODE_PARAM_RE = re.compile(r'[?&]finnkode=(\d+)')
+FINNKODE_SHORT_URL_RE = re.compile(r'finn\.no/(\d{6,12})(?:\?|$)')
+FINNKODE_ENCODED_RE = re.compile(r'finn\.no%2F(\d{6,12})')
+
+
 def extract_finnkode(url):
     """
     Extract the finnkode (unique property ID) from a Finn.no URL.
@@ -317,6 +349,16 @@ def extract_finnkode(url):
     if not url or not isinstance(url, str):
         return None
     
+    # Links are stable strings and the same ones are looked up repeatedly across
+    # loaders, so the parsed result is memoized per URL
+    return _extract_finnkode_cached(url)
+
+
+@lru_cache(maxsize=200_000)
+def _extract_finnkode_cached(url):
+    """
+    Memoized body of extract_finnkode; url must be a non-empty string.
+    """
     try:
         # First, decode tracking URLs
         decoded_url = decode_finn_tracking_url(url)
@@ -327,20 +369,20 @@ def extract_finnkode(url):
             decoded_url = 'https://' + decoded_url.split('www.finn.nohttps://')[1]
         
         # Method 1: Look for ?finnkode=XXXXXXXXX parameter
-        finnkode_match = re.search(r'[?&]finnkode=(\d+)', decoded_url)
+        finnkode_match = FINNKODE_PARAM_RE.search(decoded_url)
         if finnkode_match:
             return finnkode_match.group(1)
         
         # Method 2: Look for www.finn.no/XXXXXXXXX pattern (short URL format)
         # This handles decoded tracking URLs like: www.finn.no/438366970?...
-        short_url_match = re.search(r'finn\.no/(\d{6,12})(?:\?|$)', decoded_url)
+        short_url_match = FINNKODE_SHORT_URL_RE.search(decoded_url)
         if short_url_match:
             return short_url_match.group(1)
         
         # Method 3: Check in the original URL in case decoding missed something
         if url != decoded_url:
             # Check original for encoded finnkode
-            encoded_match = re.search(r'finn\.no%2F(\d{6,12})', url)
+            encoded_match = FINNKODE_ENCODED_RE.search(url)
             if encoded_match:
                 return encoded_match.group(1)
         
@@ -519,7 +561,7 @@ def merge_with_master_listings(email_df, master_csv_path=None, output_dir='outpu
         tracker.stats['step2_master_merge']['master_listings_added'] = len(master_unique)
         
         # Clean price in master_unique (in case it has 'kr' format)
-        master_unique['price'] = master_unique['price'].apply(clean_price)
+        master_unique['price'] = clean_price_series(master_unique['price'])
         
         # Add date_read for master listings entries (set to current timestamp)
         master_unique['date_read'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -641,9 +683,6 @@ def fetch_finn_emails(days_back=None, subject_keywords=None,
     return emails, mailbox
 
 def parse_properties_from_email(msg, debug=False):
-    # #region agent log
-    import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:638","message":"parse_properties_from_email entry","data":{"debug":debug,"has_html":bool(msg.html if msg else False)},"timestamp":int(__import__('time').time()*1000)})+'\n')
-    # #endregion
     """
     Parse property details from a Finn.no email HTML.
     
@@ -656,18 +695,12 @@ def parse_properties_from_email(msg, debug=False):
     """
 
     if not msg.html:
-        # #region agent log
-        import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:651","message":"No HTML in email","data":{},"timestamp":int(__import__('time').time()*1000)})+'\n')
-        # #endregion
         if debug:
             print("  [DEBUG] No HTML content in email")
         return []  # Skip if no HTML body
     
     soup = BeautifulSoup(msg.html, 'html.parser')
     properties = []
-    # #region agent log
-    import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:657","message":"After BeautifulSoup parse","data":{"html_length":len(msg.html)},"timestamp":int(__import__('time').time()*1000)})+'\n')
-    # #endregion
 
     # Find all property listing divs - try multiple patterns
     # Pattern 1: Old format - class contains "idIAvL"
@@ -682,9 +715,6 @@ def parse_properties_from_email(msg, debug=False):
             if debug:
                 print(f"  [DEBUG] Using ResponsiveList pattern: {len(listing_divs)} divs found")
     
-    # #region agent log
-    import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:673","message":"After finding listing_divs","data":{"listing_divs_count":len(listing_divs)},"timestamp":int(__import__('time').time()*1000)})+'\n')
-    # #endregion
     if debug:
         print(f"  [DEBUG] Found {len(listing_divs)} divs with property listings")
         # Also check for alternative patterns
@@ -839,23 +869,6 @@ def parse_properties_from_email(msg, debug=False):
             # Extract finnkode for logging
             finnkode = extract_finnkode(decoded_url) if decoded_url else None
             
-            # #region agent log
-            if finnkode in ['437802416', '442148776', '435383650']:
-                import json
-                try:
-                    with open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a') as f:
-                        f.write(json.dumps({
-                            'sessionId': 'debug-session',
-                            'runId': 'run1',
-                            'hypothesisId': 'A',
-                            'location': 'Email_Fetcher.py:825',
-                            'message': f'Property {finnkode} extracted from email',
-                            'data': {'finnkode': finnkode, 'title': title[:50], 'address': full_address, 'is_ambiguous': address_is_ambiguous},
-                            'timestamp': int(datetime.now().timestamp() * 1000)
-                        }) + '\n')
-                except: pass
-            # #endregion
-            
             properties.append({
                 'title': title,
                 'address': full_address,
@@ -879,15 +892,9 @@ def parse_properties_from_email(msg, debug=False):
                 logger.info(f"[EMAIL_FETCH] Property {finnkode}: Extracted from email - '{title}' at '{full_address}'")
             
         except Exception as e:
-            # #region agent log
-            import json, traceback; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:876","message":"Listing parsing exception","data":{"error":str(e),"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
             # Skip this listing if there's an error
             print(f"Error parsing listing: {e}")
             continue
-    # #region agent log
-    import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:881","message":"parse_properties_from_email return","data":{"properties_count":len(properties)},"timestamp":int(__import__('time').time()*1000)})+'\n')
-    # #endregion
     return properties  # Return the list of properties
 
 
@@ -963,24 +970,6 @@ def load_processed_finnkodes_from_distances_csv(output_dir='output', file_suffix
                         if finnkode:
                             processed_finnkodes.add(finnkode)
                     
-                    # #region agent log
-                    target_finnkodes = ['437802416', '442148776', '435383650']
-                    for target_fk in target_finnkodes:
-                        if target_fk in processed_finnkodes:
-                            import json
-                            try:
-                                with open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a') as f:
-                                    f.write(json.dumps({
-                                        'sessionId': 'debug-session',
-                                        'runId': 'run1',
-                                        'hypothesisId': 'C',
-                                        'location': 'Email_Fetcher.py:943',
-                                        'message': f'Property {target_fk} in processed_finnkodes (will be filtered)',
-                                        'data': {'finnkode': target_fk, 'processed_count': len(processed_finnkodes)},
-                                        'timestamp': int(datetime.now().timestamp() * 1000)
-                                    }) + '\n')
-                            except: pass
-                    # #endregion
             except pd.errors.EmptyDataError:
                 # File exists but has no data (empty or only header)
                 pass
@@ -1034,9 +1023,6 @@ def fetch_and_parse_emails_workflow(args):
     days_back = getattr(args, 'days_back', CONFIG['days_back'])
     subject_keywords = getattr(args, 'subject_keywords', CONFIG['subject_keywords'])
     property_type = getattr(args, 'property_type', 'rental')  # Get property_type from args
-    # #region agent log
-    import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"C","location":"Email_Fetcher.py:1015","message":"fetch_and_parse_emails_workflow entry","data":{"property_type":property_type,"output_dir":output_dir},"timestamp":int(__import__('time').time()*1000)})+'\n')
-    # #endregion
     
     # Load existing property links to filter duplicates
     # In test mode, don't filter duplicates - we want to test the full workflow
@@ -1091,13 +1077,7 @@ def fetch_and_parse_emails_workflow(args):
             # Parse properties from email
             # Enable debug logging if we're having issues (can be made configurable)
             debug_parsing = True  # Set to True to enable debug output
-            # #region agent log
-            import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:1069","message":"Before parse_properties_from_email","data":{"property_type":property_type,"email_index":i,"email_subject":msg.subject[:50],"has_html":bool(msg.html)},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
             props = parse_properties_from_email(msg, debug=debug_parsing)
-            # #region agent log
-            import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:1072","message":"After parse_properties_from_email","data":{"property_type":property_type,"props_count":len(props) if props else 0,"props_sample":props[:2] if props else []},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
 
             # Check if any properties were found
             if not props:
@@ -1136,9 +1116,6 @@ def fetch_and_parse_emails_workflow(args):
             time.sleep(2)  # Wait 2 seconds between emails
 
         except Exception as e:
-            # #region agent log
-            import json, traceback; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"A","location":"Email_Fetcher.py:1108","message":"Email parsing exception","data":{"property_type":property_type,"email_index":i,"error":str(e),"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
             print(f"❌ Error: {e}")
             import traceback
             traceback.print_exc()
@@ -1221,26 +1198,6 @@ def fetch_and_parse_emails_workflow(args):
                 duplicates_mask = df_normal['_finnkode'].isin(processed_finnkodes)
                 duplicate_count = duplicates_mask.sum()
                 
-                # #region agent log
-                target_finnkodes = ['437802416', '442148776', '435383650']
-                for target_fk in target_finnkodes:
-                    if target_fk in df_normal['_finnkode'].values:
-                        is_duplicate = target_fk in processed_finnkodes
-                        import json
-                        try:
-                            with open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a') as f:
-                                f.write(json.dumps({
-                                    'sessionId': 'debug-session',
-                                    'runId': 'run1',
-                                    'hypothesisId': 'B',
-                                    'location': 'Email_Fetcher.py:1150',
-                                    'message': f'Property {target_fk} in deduplication check',
-                                    'data': {'finnkode': target_fk, 'is_duplicate': is_duplicate, 'in_processed_finnkodes': target_fk in processed_finnkodes, 'processed_count': len(processed_finnkodes)},
-                                    'timestamp': int(datetime.now().timestamp() * 1000)
-                                }) + '\n')
-                        except: pass
-                # #endregion
-                
                 tracker.stats['step3_deduplication']['before_count'] = before_count
                 tracker.stats['step3_deduplication']['duplicates_removed'] = duplicate_count
                 
@@ -70,6 +70,43 @@ CONFIG = {
         },
     },
     
+    # ============================================
+    # API PERFORMANCE
+    # ============================================
+    
+    # Number of Google Maps requests allowed in flight at the same time
+    # The rate limiter still caps total throughput; 1 = fully sequential
+    'api_workers': 10,
+    
+    # Keep place search, work-distance and place travel-time results in a local SQLite file
+    # (output/.place_cache.db) between runs so re-runs don't pay for the same
+    # Places / Distance Matrix requests again
+    'place_cache_enabled': True,
+    
+    # Re-search an area after this many days (new gyms open, old ones close)
+    'place_cache_ttl_days': 30,
+    
+    # Re-query a cached work distance or place travel time after this many days (timetables change)
+    'distance_cache_ttl_days': 7,
+    
+    # Upper bound on door-to-door transit speed (straight-line km per hour)
+    # Properties further from work than max_transit_time_work allows at this speed are
+    # skipped without a Distance Matrix call; set to None to query every property.
+    # Kept deliberately high (regional/airport trains run well above 100 km/h) so the
+    # pre-filter only drops properties no real route could reach in time
+    'max_expected_transit_kmh': 150,
+    
+    # ============================================
+    # OUTPUT FORMAT
+    # ============================================
+    
+    # Storage format for the distances table that is reloaded on the next run
+    #   'csv'     = CSV only (default)
+    #   'parquet' = also write a zstd-compressed .parquet copy and reload from it
+    #   'feather' = also write a zstd-compressed .feather copy and reload from it
+    # The CSV is always written, since the email notifier and other scripts read it
+    'output_format': 'csv',
+    
     # ============================================
     # TEST MODE
     # ============================================
@@ -2,17 +2,38 @@
 # Implement distance calculation using Distance Matrix API
 
 import pandas as pd
+import numpy as np
 import os
+import sys
+import json
+import sqlite3
 import googlemaps
 from dotenv import load_dotenv
 import time
+import threading
+import bisect
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from math import radians, cos, sin, asin, sqrt
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
 
 import logging
+import logging.handlers
+import queue
+import atexit
 from datetime import datetime
 from tracking_summary import tracker
 from config import CONFIG, get_type_aware_filename, load_property_type_config, load_api_safety_config
-from Email_Fetcher import extract_finnkode
+from Email_Fetcher import extract_finnkode, clean_price_series, FINNKODE_PARAM_RE
+
+# Try to import numba - haversine_km_vec stays on plain NumPy if not installed
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # ================================================
 # PRICE CLEANING UTILITY
@@ -63,16 +84,48 @@ if GOOGLE_API_KEY:
 # LOGGING SETUP
 # ================================================
 
+# Background listener that drains queued log records to the console/file handlers
+log_listener = None
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that relies on block buffering instead of flushing after every record.
+    
+    StreamHandler.emit() calls flush() after each record, which costs one write()
+    syscall per log line. Here flush() is a no-op and the file is opened with a
+    64 KB buffer, so data reaches disk when the buffer fills or the handler is
+    closed (logging.shutdown closes it at interpreter exit).
+    """
+    
+    def __init__(self, filename, mode='a', encoding=None, buffer_size=64 * 1024):
+        self.buffer_size = buffer_size
+        super().__init__(filename, mode=mode, encoding=encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def flush(self):
+        # Intentionally skip the per-record flush; close() flushes the buffer
+        pass
+
 def setup_logging(output_dir=None):
     """
     Setup logging for the distance calculator.
     
+    The logger itself only has a QueueHandler; the console and file handlers run on a
+    QueueListener thread, so logging calls in the API loops never wait on disk I/O.
+    The listener is stopped (and the queue drained) at interpreter exit.
+    
     Args:
         output_dir: Directory for log file (defaults to script_dir/output)
     
     Returns:
         Logger instance
     """
+    global log_listener
+    
     logger = logging.getLogger('distance_calculator')
     logger.setLevel(logging.INFO)
     
@@ -87,17 +140,24 @@ def setup_logging(output_dir=None):
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
         
         # File handler
         if output_dir is None:
             output_dir = os.path.join(script_dir, 'output')
         log_file = os.path.join(output_dir, 'distance_calculator.log')
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = BufferedFileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Records are enqueued on the calling thread and written by the listener thread
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        log_listener = logging.handlers.QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        log_listener.start()
+        atexit.register(log_listener.stop)
         
         logger.info("="*70)
         logger.info("LOGGING INITIALIZED")
@@ -109,6 +169,135 @@ def setup_logging(output_dir=None):
 # Initialize logger with default output directory
 logger = setup_logging()
 
+# ================================================
+# OUTPUT FILES (CSV + OPTIONAL COLUMNAR COPY)
+# ================================================
+
+def write_csv(df, csv_path):
+    """
+    Write a DataFrame to CSV (without index) in the format every output file shares.
+    
+    All CSV outputs go through here so they stay byte-compatible with each other and
+    with earlier runs. pyarrow's CSV writer is deliberately not used: it quotes every
+    string, writes booleans as true/false and drops the '.0' from whole floats, which
+    changes the files that the next run and Email_Fetcher read back.
+    
+    Args:
+        df: DataFrame to save
+        csv_path: Output CSV path
+    """
+    df.to_csv(csv_path, index=False, encoding='utf-8')
+
+
+COLUMNAR_OUTPUT_FORMATS = ('parquet', 'feather')
+
+
+def get_columnar_path(csv_path, output_format=None):
+    """
+    Path of the Parquet/Feather copy that sits next to a CSV file.
+    
+    Args:
+        csv_path: Path to the CSV file
+        output_format: 'csv', 'parquet' or 'feather' (defaults to CONFIG['output_format'])
+    
+    Returns:
+        Path or None: Columnar file path, or None when output_format is 'csv'
+    """
+    if output_format is None:
+        output_format = CONFIG.get('output_format', 'csv')
+    if output_format not in COLUMNAR_OUTPUT_FORMATS:
+        return None
+    return Path(csv_path).with_suffix(f'.{output_format}')
+
+
+def write_columnar_copy(df, csv_path, output_format=None):
+    """
+    Write a zstd-compressed Parquet/Feather copy of a table next to its CSV.
+    
+    Does nothing when output_format is 'csv'. Failures (missing engine, column types
+    Arrow can't store) are logged and ignored - the CSV remains the source of truth.
+    
+    Args:
+        df: DataFrame that was just saved to csv_path
+        csv_path: Path of the CSV file
+        output_format: 'csv', 'parquet' or 'feather' (defaults to CONFIG['output_format'])
+    """
+    columnar_path = get_columnar_path(csv_path, output_format)
+    if columnar_path is None:
+        return
+    
+    try:
+        # Arrow needs one type per column: store mixed object columns (e.g. a price
+        # column holding both '13 000 kr' and 13000) as strings, like the CSV does
+        mixed_cols = [
+            col for col in df.columns
+            if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) in ('mixed', 'mixed-integer')
+        ]
+        if mixed_cols:
+            df = df.copy()
+            for col in mixed_cols:
+                df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+        
+        if columnar_path.suffix == '.parquet':
+            df.to_parquet(columnar_path, compression='zstd', index=False)
+        else:
+            df.reset_index(drop=True).to_feather(columnar_path, compression='zstd')
+    except Exception as e:
+        logger.warning(f"Could not write {columnar_path.name} (CSV is still saved): {e}")
+
+
+def read_distances_table(csv_path, output_format=None, usecols=None, dtype=None):
+    """
+    Load a saved table, preferring its Parquet/Feather copy when one is configured.
+    
+    The columnar copy is only used if it is at least as new as the CSV, so a CSV
+    edited or rewritten on its own is never shadowed by a stale copy.
+    
+    Args:
+        csv_path: Path of the CSV file
+        output_format: 'csv', 'parquet' or 'feather' (defaults to CONFIG['output_format'])
+        usecols: Optional collection of column names to load; names not present in the
+                 file are ignored (older files may lack newer columns)
+        dtype: Optional {column: dtype} mapping passed to the CSV parser
+    
+    Returns:
+        pd.DataFrame: Loaded table
+    """
+    columnar_path = get_columnar_path(csv_path, output_format)
+    if columnar_path is not None:
+        try:
+            if columnar_path.stat().st_mtime >= Path(csv_path).stat().st_mtime:
+                if columnar_path.suffix == '.parquet':
+                    df = pd.read_parquet(columnar_path)
+                else:
+                    df = pd.read_feather(columnar_path)
+                if usecols is not None:
+                    df = df[[col for col in df.columns if col in usecols]]
+                return df
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not read {columnar_path.name}, falling back to CSV: {e}")
+    
+    read_kwargs = {}
+    if usecols is not None:
+        wanted = set(usecols)
+        read_kwargs['usecols'] = lambda col: col in wanted
+    
+    if dtype:
+        try:
+            return pd.read_csv(csv_path, dtype=dtype, **read_kwargs)
+        except ValueError as e:
+            # A stray non-numeric cell shouldn't lose the whole file - let pandas infer instead
+            logger.debug(f"Explicit dtypes failed for {csv_path}, re-reading with inferred dtypes: {e}")
+    return pd.read_csv(csv_path, **read_kwargs)
+
+# Column types of the geocoded input CSV that are known up front: coordinates are parsed
+# straight to float64, and geocode_status (a couple of distinct values) is stored as
+# category codes, so the 'Success' filter compares codes instead of strings.
+# link/address stay plain object strings - the workflow tests them with 'if link:'
+GEOCODED_CSV_DTYPES = {'latitude': 'float64', 'longitude': 'float64', 'geocode_status': 'category'}
+
 # ================================================
 # RATE LIMITING AND API ERROR HANDLING
 # ================================================
@@ -117,48 +306,76 @@ MAX_REQUESTS_PER_WINDOW = 90
 TIME_WINDOW_SECONDS = 100
 
 # Track API calls
+# Per-API timestamps are kept oldest-first in a deque, so expiring old calls is a popleft
 api_call_tracker = {
-    'distance_matrix': [],
-    'places': [],
+    'distance_matrix': deque(),
+    'places': deque(),
     'total_calls': 0
 }
 
+# Guards api_call_tracker and the step5 API counters when calls run on worker threads
+api_call_tracker_lock = threading.Lock()
+
 def check_rate_limit(api_type='distance_matrix'):
     """
-    Checks if we're approaching rate limits and waits if necessary.
+    Waits until a call of api_type fits in the rate-limit window, then returns.
+    
+    Sliding window: up to MAX_REQUESTS_PER_WINDOW calls go through immediately, and the
+    next call waits only until the call that would push the window over the limit has
+    aged out. The slot is reserved under api_call_tracker_lock but the wait happens
+    outside it, so concurrent workers each get their own future slot instead of
+    serializing behind one sleeping thread.
     """
-    current_time = time.time()
+    wait_time = acquire_rate_limit_slot(api_type)
+    if wait_time > 0:
+        logger.debug(f"Rate limit reached for {api_type} ({MAX_REQUESTS_PER_WINDOW} calls per {TIME_WINDOW_SECONDS}s). Waiting {wait_time:.1f}s...")
+        time.sleep(wait_time)
+
+
+def _expire_old_calls(call_times, current_time):
+    """
+    Drop timestamps that have left the rate-limit window (amortized O(1) per call).
     
-    if api_type in api_call_tracker:
-        api_call_tracker[api_type] = [
-            ts for ts in api_call_tracker[api_type] 
-            if current_time - ts < TIME_WINDOW_SECONDS
-        ]
+    Args:
+        call_times: deque of call timestamps, oldest first
+        current_time: Current time.time() value
+    """
+    cutoff = current_time - TIME_WINDOW_SECONDS
+    while call_times and call_times[0] <= cutoff:
+        call_times.popleft()
+
+
+def acquire_rate_limit_slot(api_type):
+    """
+    Reserve the earliest rate-limit slot for a call of api_type.
+    
+    The window holds the timestamps of recent (and already reserved) calls. If fewer
+    than MAX_REQUESTS_PER_WINDOW are in it, the slot is now; otherwise it is the moment
+    the MAX_REQUESTS_PER_WINDOW-th most recent call leaves the window. The reservation
+    is recorded immediately so later callers queue behind it.
+    
+    Args:
+        api_type: 'distance_matrix' or 'places' (other values are not rate limited)
+    
+    Returns:
+        float: Seconds the caller must sleep before making the call (0 = go now)
+    """
+    with api_call_tracker_lock:
+        current_time = time.time()
+        call_times = api_call_tracker.get(api_type)
+        if call_times is None:
+            return 0.0
         
-        calls_in_window = len(api_call_tracker[api_type])
-        usage_percentage = calls_in_window / MAX_REQUESTS_PER_WINDOW
+        _expire_old_calls(call_times, current_time)
         
-        if usage_percentage >= 0.95:
-            oldest_call = min(api_call_tracker[api_type])
-            wait_time = TIME_WINDOW_SECONDS - (current_time - oldest_call) + 1
-            logger.debug(f"Rate limit near limit for {api_type} ({calls_in_window}/{MAX_REQUESTS_PER_WINDOW}). Waiting {wait_time:.1f}s...")
-            time.sleep(wait_time)
-            
-            current_time = time.time()
-            api_call_tracker[api_type] = [
-                ts for ts in api_call_tracker[api_type] 
-                if current_time - ts < TIME_WINDOW_SECONDS
-            ]
-            
-        elif usage_percentage >= 0.90:
-            wait_time = 2.0
-            logger.debug(f"Rate limit high for {api_type} ({calls_in_window}/{MAX_REQUESTS_PER_WINDOW}). Adding {wait_time}s delay...")
-            time.sleep(wait_time)
-            
-        elif usage_percentage >= 0.80:
-            wait_time = 0.5
-            logger.debug(f"Rate limit moderate for {api_type} ({calls_in_window}/{MAX_REQUESTS_PER_WINDOW}). Adding {wait_time}s delay...")
-            time.sleep(wait_time)
+        if len(call_times) < MAX_REQUESTS_PER_WINDOW:
+            slot_time = current_time
+        else:
+            slot_time = max(current_time, call_times[-MAX_REQUESTS_PER_WINDOW] + TIME_WINDOW_SECONDS)
+        
+        # Earlier reservations may lie in the future; keep the deque sorted oldest-first
+        bisect.insort(call_times, slot_time)
+        return slot_time - current_time
 
 
 def handle_api_error(error, api_type='distance_matrix', retry_count=0, max_retries=3):
@@ -185,9 +402,9 @@ def handle_api_error(error, api_type='distance_matrix', retry_count=0, max_retri
         logger.warning(f"Rate limit error for {api_type} (attempt {retry_count + 1}/{max_retries + 1}). Waiting {wait_time}s...")
         time.sleep(wait_time)
         
-        if api_type in api_call_tracker:
-            api_call_tracker[api_type] = []
-        
+        # Leave api_call_tracker alone: other workers' reserved slots must stay in the
+        # window, otherwise they would all fire at once after this backoff. The retry
+        # reserves a fresh slot behind them through check_rate_limit().
         return True
         
     elif is_temporary and retry_count < max_retries:
@@ -201,6 +418,33 @@ def handle_api_error(error, api_type='distance_matrix', retry_count=0, max_retri
         return False
 
 
+# One long-lived pool for individual API requests, instead of a new pool (and new
+# threads) for every property/category lookup. Only leaf calls may run on it - a task
+# that itself waits on this pool could deadlock once all workers are busy
+_api_executor = None
+_api_executor_lock = threading.Lock()
+
+
+def get_api_executor():
+    """
+    Return the shared thread pool for concurrent Google Maps requests.
+    
+    Created on first use with CONFIG['api_workers'] threads and reused for the rest of
+    the process; the rate limiter, not the pool size, caps request throughput.
+    
+    Returns:
+        ThreadPoolExecutor: Shared executor
+    """
+    global _api_executor
+    with _api_executor_lock:
+        if _api_executor is None:
+            _api_executor = ThreadPoolExecutor(
+                max_workers=max(1, CONFIG.get('api_workers', 10)),
+                thread_name_prefix='gmaps-api'
+            )
+        return _api_executor
+
+
 def make_api_call_with_retry(api_func, *args, api_type='distance_matrix', **kwargs):
     """
     Wrapper function that makes an API call with rate limiting and retry logic.
@@ -212,18 +456,16 @@ def make_api_call_with_retry(api_func, *args, api_type='distance_matrix', **kwar
             check_rate_limit(api_type)
             result = api_func(*args, **kwargs)
             
-            # Track successful API call
+            # Track successful API call (its window timestamp was recorded by check_rate_limit)
             if result is not None:
-                current_time = time.time()
-                if api_type in api_call_tracker:
-                    api_call_tracker[api_type].append(current_time)
-                api_call_tracker['total_calls'] += 1
-                
-                # Update tracker stats
-                if api_type == 'distance_matrix':
-                    tracker.stats['step5_distance_calculation']['api_calls_distance_matrix'] += 1
-                elif api_type == 'places':
-                    tracker.stats['step5_distance_calculation']['api_calls_places'] += 1
+                with api_call_tracker_lock:
+                    api_call_tracker['total_calls'] += 1
+                    
+                    # Update tracker stats
+                    if api_type == 'distance_matrix':
+                        tracker.stats['step5_distance_calculation']['api_calls_distance_matrix'] += 1
+                    elif api_type == 'places':
+                        tracker.stats['step5_distance_calculation']['api_calls_places'] += 1
             
             return result
             
@@ -249,12 +491,11 @@ def get_api_stats():
         'places_calls_in_window': 0
     }
     
-    for api_type in ['distance_matrix', 'places']:
-        if api_type in api_call_tracker:
-            stats[f'{api_type}_calls_in_window'] = len([
-                ts for ts in api_call_tracker[api_type]
-                if current_time - ts < TIME_WINDOW_SECONDS
-            ])
+    with api_call_tracker_lock:
+        for api_type in ['distance_matrix', 'places']:
+            if api_type in api_call_tracker:
+                _expire_old_calls(api_call_tracker[api_type], current_time)
+                stats[f'{api_type}_calls_in_window'] = len(api_call_tracker[api_type])
     
     return stats
 
@@ -283,6 +524,60 @@ def haversine_distance(lat1, lon1, lat2, lon2):
     return R * c
 
 
+# Below this many points the NumPy array setup costs more than it saves
+HAVERSINE_VEC_MIN_POINTS = 16
+
+
+def haversine_km_vec(lats, lons, wlat, wlng):
+    """
+    Vectorized haversine: straight-line distance in kilometers from many points to one point.
+    
+    Same formula as haversine_distance, evaluated with NumPy over whole arrays so that
+    N distances cost one Python call instead of N.
+    
+    Args:
+        lats: Array-like of latitudes
+        lons: Array-like of longitudes
+        wlat: Latitude of the single target point (e.g. work location)
+        wlng: Longitude of the single target point
+    
+    Returns:
+        numpy.ndarray: Distances in kilometers, same length as lats
+    """
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+    if NUMBA_AVAILABLE and lats.ndim == 1 and len(lats) >= HAVERSINE_NUMBA_MIN_POINTS:
+        return _haversine_km_numba(np.ascontiguousarray(lats), np.ascontiguousarray(lons), float(wlat), float(wlng))
+    
+    lat1 = np.radians(lats)
+    lat2 = np.radians(wlat)
+    dlat = lat2 - lat1
+    dlon = np.radians(wlng) - np.radians(lons)
+    a = np.sin(dlat / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2)**2
+    return 6371.0 * 2 * np.arcsin(np.sqrt(a))
+
+
+# From this many points haversine_km_vec hands off to the compiled kernel (numba only):
+# one fused pass over all cores instead of a temporary array per NumPy operation
+HAVERSINE_NUMBA_MIN_POINTS = 100_000
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _haversine_km_numba(lats, lons, wlat, wlng):
+        """
+        Compiled haversine_km_vec body for large 1-D float64 arrays.
+        """
+        lat2 = radians(wlat)
+        lam2 = radians(wlng)
+        cos_lat2 = cos(lat2)
+        out = np.empty(lats.shape[0])
+        for i in prange(lats.shape[0]):
+            lat1 = radians(lats[i])
+            a = sin((lat2 - lat1) / 2)**2 + cos(lat1) * cos_lat2 * sin((lam2 - radians(lons[i])) / 2)**2
+            out[i] = 6371.0 * 2 * asin(sqrt(a))
+        return out
+
+
 # ================================================
 # DEFAULT CONFIGURATION VALUES
 # ================================================
@@ -295,8 +590,10 @@ DEFAULT_TEST_MODE = True
 DEFAULT_TEST_LIMIT = 20
 DEFAULT_PLACE_SEARCH_RADIUS_METERS = 10000
 DEFAULT_MIN_PLACES_REQUIRED = 1
+MAX_EXAMPLE_MATCHES = 10  # Place names returned by find_nearby_places
 
-DEFAULT_PLACE_SEARCH_KEYWORDS = [
+# Tuples: searched in this order, and immutable so callers can't alter the defaults
+DEFAULT_PLACE_SEARCH_KEYWORDS = (
     'EVO',
     'SATS',
     'Evo Fitness',
@@ -307,22 +604,75 @@ DEFAULT_PLACE_SEARCH_KEYWORDS = [
     'karate',
     'muay thai',
     'bjj'
-]
+)
 
-DEFAULT_PLACE_SEARCH_TYPES = [
+DEFAULT_PLACE_SEARCH_TYPES = (
     'gym',
     'shopping_mall',
     'grocery_or_supermarket'
-]
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DistanceConfig:
+    """
+    Immutable run configuration for calculate_distances_and_filter.
+    
+    Built once from the argparse/args object so the workflow reads plain attributes
+    instead of repeated getattr(args, name, default) lookups. Field names match the
+    attribute names used on args; list options are stored as tuples so the config
+    stays hashable.
+    """
+    max_transit_time_work: int = DEFAULT_MAX_TRAVEL_TIME_MINUTES
+    test_mode: bool = DEFAULT_TEST_MODE
+    test_limit: int = DEFAULT_TEST_LIMIT
+    output_dir: str = 'output'
+    work_lat: float = DEFAULT_WORK_LAT
+    work_lng: float = DEFAULT_WORK_LNG
+    search_radius: int = DEFAULT_PLACE_SEARCH_RADIUS_METERS
+    facility_keywords: tuple = None
+    place_keywords: tuple = None
+    place_types: tuple = None
+    file_suffix: str = ''
+    property_type: str = 'rental'
+    run_smoke_test: bool = False
+    
+    @classmethod
+    def from_args(cls, args):
+        """
+        Build a DistanceConfig from an args object, using defaults for missing attributes.
+        
+        Args:
+            args: Argument object (argparse.Namespace or similar) or an existing DistanceConfig
+        
+        Returns:
+            DistanceConfig: Frozen configuration
+        """
+        if isinstance(args, cls):
+            return args
+        
+        values = {}
+        for field in fields(cls):
+            value = getattr(args, field.name, field.default)
+            if isinstance(value, list):
+                value = tuple(value)
+            values[field.name] = value
+        return cls(**values)
 
 # Place categories from config.py - users can edit config.py to add/modify categories
 # The column_prefix defaults to the category name if not specified
 def get_place_categories():
-    """Get place categories from config.py with defaults for missing fields."""
+    """Get place categories from config.py with defaults for missing fields.
+    
+    Keywords are stored as tuples (search order kept, can't be mutated through a
+    shared reference) together with the sorted key used by the on-disk place cache.
+    """
     categories = {}
     for name, settings in CONFIG['place_categories'].items():
+        keywords = tuple(settings.get('keywords', ()))
         categories[name] = {
-            'keywords': settings.get('keywords', []),
+            'keywords': keywords,
+            'keywords_key': '|'.join(sorted(keywords)),
             'calculate_transit': settings.get('calculate_transit', False),
             'column_prefix': settings.get('column_prefix', name)  # Default to category name
         }
@@ -330,15 +680,447 @@ def get_place_categories():
 
 DEFAULT_PLACE_CATEGORIES = get_place_categories()
 
+class LRUCache:
+    """
+    Bounded, thread-safe mapping that evicts the least recently used entry.
+    
+    Used for the in-memory API caches so a long run (or a long-lived process calling
+    calculate_distances_and_filter repeatedly) can't grow them without limit, and so
+    worker threads can read and fill them concurrently.
+    """
+    
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the cached value (marking it recently used), or default."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._data
+    
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Entries kept by each in-memory place cache (the on-disk cache is not bounded by this)
+PLACE_CACHE_MAX_ENTRIES = 10000
+
 # In-memory cache for place searches (to avoid duplicate API calls)
-place_search_cache = {}
+# Keyed by (grid_bucket, category_name, radius) so nearby properties share one search
+place_search_cache = LRUCache(PLACE_CACHE_MAX_ENTRIES)
+
+
+@dataclass(slots=True)
+class PlaceCandidate:
+    """
+    One place returned by a category search.
+    
+    Slotted rather than a dict: the place caches hold thousands of these, and the
+    nearest-place loop reads lat/lng from every one of them.
+    """
+    name: str
+    lat: float
+    lng: float
+    place_id: str
+    distance_km: float = None  # Set only on the copy returned as the nearest place
+
+# In-memory cache of individual Places queries, so the same keyword (or place type)
+# searched at the same spot by another category isn't sent twice. Keyed by
+# (kind, keyword_or_type, round(lat, 4), round(lng, 4), radius); holds only the
+# response's 'results' list
+place_query_cache = LRUCache(PLACE_CACHE_MAX_ENTRIES)
+
+# Grid resolution for sharing place searches: 1/200 degree ~ 550 m north-south
+# (~280 m east-west at Oslo's latitude). Properties in the same cell reuse one
+# Places response; the nearest place is still picked from each property's own location.
+PLACE_SEARCH_GRID_DIVISOR = 200
+
+
+def get_place_search_bucket(lat, lng):
+    """
+    Map a coordinate onto the ~500 m grid cell used to share place searches.
+    
+    Args:
+        lat: Latitude
+        lng: Longitude
+    
+    Returns:
+        tuple: (lat_cell, lng_cell) integer grid indices
+    """
+    return (int(round(lat * PLACE_SEARCH_GRID_DIVISOR)), int(round(lng * PLACE_SEARCH_GRID_DIVISOR)))
+
+
+# On-disk cache of place searches, shared across runs (and between rental/sales).
+# Lives in output/ next to the log and CSVs rather than in the source tree
+PLACE_CACHE_DB_PATH = os.path.join(script_dir, 'output', '.place_cache.db')
+_place_cache_conn = None
+_place_cache_lock = threading.Lock()
+
+
+def get_place_cache_key(bucket, category_name, radius_meters, keywords):
+    """
+    Build the on-disk cache key for one place search.
+    
+    The keywords are part of the key so editing a category's keywords in config.py
+    never serves results from the old search terms.
+    
+    Args:
+        bucket: Grid cell from get_place_search_bucket
+        category_name: Place category name
+        radius_meters: Search radius
+        keywords: Keywords searched for this category, or their precomputed
+            '|'-joined sorted string (the category's 'keywords_key')
+    
+    Returns:
+        str: Cache key
+    """
+    if not isinstance(keywords, str):
+        keywords = '|'.join(sorted(keywords))
+    return f"{bucket[0]},{bucket[1]},{radius_meters},{category_name},{keywords}"
+
+
+def _get_place_cache_conn():
+    """
+    Open (once) the SQLite place cache, creating its tables if needed.
+    
+    The same file also holds the work-distance and place travel-time caches
+    (see load_cached_work_distances and load_cached_place_travel_times).
+    
+    Returns:
+        sqlite3.Connection or None: None if the cache is disabled or can't be opened
+    """
+    global _place_cache_conn
+    
+    if not CONFIG.get('place_cache_enabled', True):
+        return None
+    if _place_cache_conn is None:
+        try:
+            os.makedirs(os.path.dirname(PLACE_CACHE_DB_PATH), exist_ok=True)
+            _place_cache_conn = sqlite3.connect(PLACE_CACHE_DB_PATH, check_same_thread=False)
+            # WAL: a rental and a sales run can read the cache while the other writes,
+            # and each commit is an append instead of a rewrite of the database file
+            _place_cache_conn.execute("PRAGMA journal_mode=WAL")
+            _place_cache_conn.execute("PRAGMA synchronous=NORMAL")
+            _place_cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS places (key TEXT PRIMARY KEY, payload TEXT, fetched_at REAL)"
+            )
+            _place_cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS work_distances "
+                "(key TEXT PRIMARY KEY, distance_km REAL, duration_minutes REAL, fetched_at REAL)"
+            )
+            _place_cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS place_travel_times "
+                "(key TEXT PRIMARY KEY, duration_minutes REAL, fetched_at REAL)"
+            )
+            _place_cache_conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Place cache disabled - could not open {PLACE_CACHE_DB_PATH}: {e}")
+            CONFIG['place_cache_enabled'] = False
+            _place_cache_conn = None
+    return _place_cache_conn
+
+
+def load_cached_place_search(key):
+    """
+    Look up a place search in the on-disk cache.
+    
+    Args:
+        key: Key from get_place_cache_key
+    
+    Returns:
+        list or None: Cached candidate places, or None on a miss or an expired entry
+    """
+    with _place_cache_lock:
+        conn = _get_place_cache_conn()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute("SELECT payload, fetched_at FROM places WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Place cache lookup failed: {e}")
+            return None
+    
+    if row is None:
+        return None
+    payload, fetched_at = row
+    max_age_seconds = CONFIG.get('place_cache_ttl_days', 30) * 24 * 3600
+    if time.time() - fetched_at > max_age_seconds:
+        return None  # Expired - places open and close, so search again
+    return [PlaceCandidate(**place) for place in json.loads(payload)]
+
+
+def store_cached_place_search(key, candidates):
+    """
+    Save a completed place search to the on-disk cache.
+    
+    Args:
+        key: Key from get_place_cache_key
+        candidates: List of PlaceCandidate records (stored as name/lat/lng/place_id dicts)
+    """
+    payload = json.dumps([
+        {'name': place.name, 'lat': place.lat, 'lng': place.lng, 'place_id': place.place_id}
+        for place in candidates
+    ])
+    with _place_cache_lock:
+        conn = _get_place_cache_conn()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO places (key, payload, fetched_at) VALUES (?, ?, ?)",
+                (key, payload, time.time())
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Place cache write failed: {e}")
+
+
+def get_work_distance_cache_key(origin_cell, work_lat, work_lng, mode='transit'):
+    """
+    Build the on-disk cache key for one origin cell's trip to work.
+    
+    Args:
+        origin_cell: (lat, lng) already rounded to ORIGIN_SNAP_DECIMALS
+        work_lat: Work location latitude
+        work_lng: Work location longitude
+        mode: Travel mode
+    
+    Returns:
+        str: Cache key
+    """
+    return f"{origin_cell[0]:.{ORIGIN_SNAP_DECIMALS}f},{origin_cell[1]:.{ORIGIN_SNAP_DECIMALS}f},{work_lat},{work_lng},{mode}"
+
+
+def load_cached_work_distances(keys):
+    """
+    Look up work distances in the on-disk cache.
+    
+    Args:
+        keys: Keys from get_work_distance_cache_key
+    
+    Returns:
+        dict: key -> (distance_km, duration_minutes) for every unexpired hit
+    """
+    max_age_seconds = CONFIG.get('distance_cache_ttl_days', 7) * 24 * 3600
+    min_fetched_at = time.time() - max_age_seconds
+    keys = list(keys)
+    hits = {}
+    
+    with _place_cache_lock:
+        conn = _get_place_cache_conn()
+        if conn is None:
+            return hits
+        try:
+            # Stay well under SQLite's bound-parameter limit
+            for chunk_start in range(0, len(keys), 500):
+                chunk = keys[chunk_start:chunk_start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, distance_km, duration_minutes FROM work_distances "
+                    f"WHERE key IN ({placeholders}) AND fetched_at > ?",
+                    (*chunk, min_fetched_at)
+                ).fetchall()
+                hits.update((key, (distance_km, duration_minutes)) for key, distance_km, duration_minutes in rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Work distance cache lookup failed: {e}")
+    
+    return hits
+
+
+def store_cached_work_distances(entries):
+    """
+    Save successful work-distance results to the on-disk cache.
+    
+    Args:
+        entries: List of (key, distance_km, duration_minutes) tuples
+    """
+    if not entries:
+        return
+    
+    with _place_cache_lock:
+        conn = _get_place_cache_conn()
+        if conn is None:
+            return
+        try:
+            fetched_at = time.time()
+            conn.executemany(
+                "INSERT OR REPLACE INTO work_distances (key, distance_km, duration_minutes, fetched_at) VALUES (?, ?, ?, ?)",
+                [(key, distance_km, duration_minutes, fetched_at) for key, distance_km, duration_minutes in entries]
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Work distance cache write failed: {e}")
+
+
+def get_place_travel_time_cache_key(property_lat, property_lng, place_lat, place_lng, mode):
+    """
+    Build the on-disk cache key for one property-to-place trip.
+    
+    Coordinates are rounded to 5 decimals (~1 m), so the same property and place
+    hit the same entry across runs even if the CSV round-trip changes the last digits.
+    
+    Args:
+        property_lat: Property latitude
+        property_lng: Property longitude
+        place_lat: Place latitude
+        place_lng: Place longitude
+        mode: Travel mode ('walking' or 'transit')
+    
+    Returns:
+        str: Cache key
+    """
+    return f"{property_lat:.5f},{property_lng:.5f},{place_lat:.5f},{place_lng:.5f},{mode}"
+
+
+def load_cached_place_travel_times(keys):
+    """
+    Look up property-to-place travel times in the on-disk cache.
+    
+    Args:
+        keys: Keys from get_place_travel_time_cache_key
+    
+    Returns:
+        dict: key -> duration_minutes for every unexpired hit
+    """
+    max_age_seconds = CONFIG.get('distance_cache_ttl_days', 7) * 24 * 3600
+    min_fetched_at = time.time() - max_age_seconds
+    keys = list(keys)
+    hits = {}
+    
+    with _place_cache_lock:
+        conn = _get_place_cache_conn()
+        if conn is None:
+            return hits
+        try:
+            # Stay well under SQLite's bound-parameter limit
+            for chunk_start in range(0, len(keys), 500):
+                chunk = keys[chunk_start:chunk_start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, duration_minutes FROM place_travel_times "
+                    f"WHERE key IN ({placeholders}) AND fetched_at > ?",
+                    (*chunk, min_fetched_at)
+                ).fetchall()
+                hits.update(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"Place travel time cache lookup failed: {e}")
+    
+    return hits
+
+
+def store_cached_place_travel_times(entries):
+    """
+    Save successful property-to-place travel times to the on-disk cache.
+    
+    Args:
+        entries: List of (key, duration_minutes) tuples
+    """
+    if not entries:
+        return
+    
+    with _place_cache_lock:
+        conn = _get_place_cache_conn()
+        if conn is None:
+            return
+        try:
+            fetched_at = time.time()
+            conn.executemany(
+                "INSERT OR REPLACE INTO place_travel_times (key, duration_minutes, fetched_at) VALUES (?, ?, ?)",
+                [(key, duration_minutes, fetched_at) for key, duration_minutes in entries]
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Place travel time cache write failed: {e}")
 
 
 # ================================================
 # COMPLETION STATUS HELPERS
 # ================================================
 
-def check_property_completion_status(row, place_categories):
+def get_required_completion_columns(place_categories):
+    """
+    List the columns that must all be non-null for a property to count as 'completed'.
+    
+    Args:
+        place_categories: Dictionary of place categories with their configuration
+    
+    Returns:
+        list: Required column names (work distance/transit, walking time per category,
+              and transit time for categories with calculate_transit=True)
+    """
+    required_cols = ['distance_to_work_km', 'transit_time_work_minutes']
+    for cat_name, cat_config in place_categories.items():
+        prefix = cat_config['column_prefix']
+        required_cols.append(f'walking_time_{prefix}_minutes')
+        if cat_config.get('calculate_transit', False):
+            required_cols.append(f'transit_time_{prefix}_minutes')
+    return required_cols
+
+
+def get_completion_mask(df, place_categories):
+    """
+    Vectorized completion check for a whole DataFrame.
+    
+    Evaluates the same rule as check_property_completion_status, but in one
+    notna().all(axis=1) pass instead of a Python call per row. A required column
+    that does not exist at all makes every row incomplete.
+    
+    Args:
+        df: DataFrame of properties
+        place_categories: Dictionary of place categories with their configuration
+    
+    Returns:
+        pd.Series: Boolean Series aligned to df.index, True where the property is completed
+    """
+    required_cols = get_required_completion_columns(place_categories)
+    if any(col not in df.columns for col in required_cols):
+        return pd.Series(False, index=df.index)
+    return df[required_cols].notna().all(axis=1)
+
+
+# processing_status only ever holds these two values - a categorical column stores
+# one small integer code per row instead of a Python string object
+PROCESSING_STATUS_DTYPE = pd.CategoricalDtype(['completed', 'incomplete'])
+
+
+def get_processing_status(completed_mask):
+    """
+    Build the processing_status column from a completion mask.
+    
+    Args:
+        completed_mask: Boolean Series/array from get_completion_mask
+    
+    Returns:
+        pd.Categorical: 'completed' / 'incomplete' per row (PROCESSING_STATUS_DTYPE);
+            saved to CSV exactly like the plain string column
+    """
+    return pd.Categorical(
+        np.where(completed_mask, 'completed', 'incomplete'),
+        dtype=PROCESSING_STATUS_DTYPE
+    )
+
+
+def check_property_completion_status(row, place_categories, required_cols=None):
     """
     Check if a property has all required data fields completed based on the configured place categories.
     
@@ -351,86 +1133,154 @@ def check_property_completion_status(row, place_categories):
     Args:
         row: A pandas Series representing a property row
         place_categories: Dictionary of place categories with their configuration
+        required_cols: Optional precomputed get_required_completion_columns(place_categories)
     
     Returns:
         str: 'completed' if all required fields are present, 'incomplete' otherwise
+    
+    Note:
+        For whole DataFrames use get_completion_mask, which checks the same columns
+        for every row at once; required_cols lets a per-row caller build the column
+        list once (get_required_completion_columns) instead of on every call.
     """
+    if required_cols is None:
+        required_cols = get_required_completion_columns(place_categories)
     try:
-        # Check work distance fields (always required)
-        distance_km = row.get('distance_to_work_km')
-        transit_time = row.get('transit_time_work_minutes')
-        
-        if pd.isna(distance_km) or pd.isna(transit_time):
-            return 'incomplete'
-        
-        # Check each place category
-        for cat_name, cat_config in place_categories.items():
-            prefix = cat_config['column_prefix']
-            
-            # Walking time is always required for each category
-            walking_col = f'walking_time_{prefix}_minutes'
-            walking_time = row.get(walking_col)
-            
-            if pd.isna(walking_time):
+        for col in required_cols:
+            if pd.isna(row.get(col)):
                 return 'incomplete'
-            
-            # Transit time required only if calculate_transit is True
-            if cat_config.get('calculate_transit', False):
-                transit_col = f'transit_time_{prefix}_minutes'
-                transit_time_place = row.get(transit_col)
-                
-                if pd.isna(transit_time_place):
-                    return 'incomplete'
-        
         return 'completed'
     except Exception:
         return 'incomplete'
 
 
-def load_existing_distance_data(output_dir='output', file_suffix='', property_type='rental'):
+def extract_finnkodes(links):
+    """
+    Vectorized extract_finnkode for a whole column of links.
+    
+    Direct URLs (?finnkode=...), the common case in saved CSVs, are handled in one
+    Series.str.extract pass with Email_Fetcher's compiled pattern; only links
+    that don't match (short sales URLs, tracking URLs) fall back to extract_finnkode.
+    
+    Args:
+        links: pandas Series of Finn.no URLs (may contain NaN)
+    
+    Returns:
+        pd.Series: finnkode strings aligned to links.index, NaN where none was found
+    """
+    links = links.astype(object)
+    is_link = links.map(lambda link: isinstance(link, str) and link != '')
+    finnkodes = links.where(is_link).astype('string').str.extract(FINNKODE_PARAM_RE, expand=False).astype(object)
+    
+    fallback = is_link & finnkodes.isna()
+    if fallback.any():
+        finnkodes[fallback] = links[fallback].map(extract_finnkode)
+    
+    return finnkodes.where(finnkodes.notna(), np.nan)
+
+
+def get_distance_result_columns(place_categories):
+    """
+    Columns produced by this step (work distance + per-category place data + run metadata).
+    
+    These are the only columns that load_existing_distance_data needs to carry over
+    from a previous run; listing details (title, price, ...) come from the new input.
+    
+    Args:
+        place_categories: Dictionary of place categories with their configuration
+    
+    Returns:
+        list: Column names
+    """
+    result_cols = ['link', 'date_read', 'work_lat', 'work_lng', 'max_transit_time_work_minutes']
+    result_cols += get_required_completion_columns(place_categories)
+    result_cols += [f"nearest_{cat_config['column_prefix']}" for cat_config in place_categories.values()]
+    return result_cols
+
+
+@lru_cache(maxsize=64)
+def _resolve_distances_path(output_dir, file_suffix='', property_type='rental'):
+    """
+    Find the distances file a run should load, stat()ing each candidate at most once.
+    
+    The type-aware name is tried first, then (rental only) the old unprefixed name when
+    it differs. Both startup loaders and the merge step share the cached answer, so the
+    same file isn't stat()ed once per loader. calculate_distances_and_filter clears the
+    cache at the start of every run, since the file is (re)written during a run.
+    
+    Args:
+        output_dir: Directory where CSV files are stored (plain string, part of the cache key)
+        file_suffix: Suffix appended to filename (e.g., '_test')
+        property_type: 'rental' or 'sales'
+    
+    Returns:
+        tuple: (Path, os.stat_result) of the existing file, or (type-aware Path, None) if
+            no distances file exists yet
+    """
+    distances_path = Path(output_dir) / get_type_aware_filename('property_listings_with_distances', property_type, file_suffix)
+    candidates = [distances_path]
+    if property_type == 'rental':
+        old_distances_path = Path(output_dir) / f'property_listings_with_distances{file_suffix}.csv'
+        if old_distances_path != distances_path:
+            candidates.append(old_distances_path)
+    
+    for path in candidates:
+        try:
+            return path, path.stat()
+        except FileNotFoundError:
+            continue
+    return distances_path, None
+
+
+def load_existing_distance_data(output_dir='output', file_suffix='', property_type='rental', place_categories=None):
     """
     Load existing distance data from the distances CSV file.
     
     Uses finnkode (unique property ID) as the key instead of link to ensure
     properties are recognized even if link format changes between runs.
+    Only the columns this step produces are read (see get_distance_result_columns).
     
     Args:
         output_dir: Directory where CSV files are stored
         file_suffix: Suffix appended to filename (e.g., '_test')
         property_type: 'rental' or 'sales' (default: 'rental' for backward compat)
+        place_categories: Place categories whose columns to load (default: DEFAULT_PLACE_CATEGORIES)
     
     Returns:
         dict: Dictionary mapping finnkode (str) to their distance/place data (dict)
     """
-    # Use type-aware filename in the correct output_dir
-    distances_filename = get_type_aware_filename('property_listings_with_distances', property_type, file_suffix)
-    distances_csv = os.path.join(output_dir, distances_filename)
+    if place_categories is None:
+        place_categories = DEFAULT_PLACE_CATEGORIES
+    result_cols = get_distance_result_columns(place_categories)
+    # Numeric result columns are parsed as float64 directly instead of being inferred
+    numeric_dtypes = {col: 'float64' for col in result_cols
+                      if col != 'link' and col != 'date_read' and not col.startswith('nearest_')}
     
-    # Also check old filename format within the same output_dir for backward compatibility (rental only)
-    paths_to_check = [distances_csv]
-    if property_type == 'rental' and file_suffix == '':
-        # For rental properties, also check old filename format (without type prefix) in the same directory
-        old_distances_csv = os.path.join(output_dir, 'property_listings_with_distances.csv')
-        if old_distances_csv != distances_csv:
-            paths_to_check.append(old_distances_csv)
+    # Type-aware filename, falling back to the old rental naming (resolved once per run)
+    csv_path, csv_stat = _resolve_distances_path(output_dir, file_suffix, property_type)
     
     existing_data = {}
     
-    # Check all possible file locations
-    for csv_path in paths_to_check:
-        if os.path.exists(csv_path):
-            try:
-                df = pd.read_csv(csv_path)
-                for _, row in df.iterrows():
-                    link = row.get('link')
-                    if link:
-                        # Extract finnkode from link and use it as the key
-                        finnkode = extract_finnkode(link)
-                        if finnkode:
-                            # Store all relevant columns for this property, keyed by finnkode
-                            existing_data[finnkode] = row.to_dict()
-            except Exception as e:
-                logger.warning(f"Could not load existing distance data from {csv_path}: {e}")
+    if csv_stat is not None:
+        try:
+            df = read_distances_table(csv_path, usecols=result_cols, dtype=numeric_dtypes)
+            if 'link' in df.columns:
+                # Extract finnkode from link and use it as the key
+                finnkodes = extract_finnkodes(df['link'])
+                has_finnkode = finnkodes.notna()
+                df = df[has_finnkode]
+                
+                # Build the row dicts from plain column lists (like pyarrow's to_pydict, then
+                # transposed) instead of DataFrame.to_dict('index'); dict() keeps the last
+                # row for a repeated finnkode, as before
+                columns = list(df.columns)
+                rows = zip(*(df[col].tolist() for col in columns))
+                existing_data.update(zip(
+                    finnkodes[has_finnkode].tolist(),
+                    (dict(zip(columns, row)) for row in rows)
+                ))
+        except Exception as e:
+            logger.warning(f"Could not load existing distance data from {csv_path}: {e}")
     
     return existing_data
 
@@ -455,6 +1305,26 @@ def work_location_matches(prev_lat, prev_lng, current_lat, current_lng, toleranc
             abs(prev_lng - current_lng) < tolerance)
 
 
+def work_location_matches_vec(prev_lats, prev_lngs, current_lat, current_lng, tolerance=0.001):
+    """
+    Vectorized work_location_matches over whole columns.
+    
+    Args:
+        prev_lats: Series/array of previous work latitudes
+        prev_lngs: Series/array of previous work longitudes
+        current_lat: Current work latitude
+        current_lng: Current work longitude
+        tolerance: Tolerance in degrees (default 0.001 ~100m)
+    
+    Returns:
+        numpy.ndarray: Boolean array, False where no previous location is stored
+    """
+    prev_lats = pd.to_numeric(pd.Series(prev_lats), errors='coerce').to_numpy(dtype=float)
+    prev_lngs = pd.to_numeric(pd.Series(prev_lngs), errors='coerce').to_numpy(dtype=float)
+    # NaN comparisons are False, which matches the scalar "no previous location" case
+    return (np.abs(prev_lats - current_lat) < tolerance) & (np.abs(prev_lngs - current_lng) < tolerance)
+
+
 def load_too_far_properties(output_dir='output', file_suffix='', property_type='rental', 
                             current_work_lat=None, current_work_lng=None, current_max_travel_time=None):
     """
@@ -477,56 +1347,37 @@ def load_too_far_properties(output_dir='output', file_suffix='', property_type='
     if current_work_lat is None or current_work_lng is None or current_max_travel_time is None:
         return set()  # Can't determine too far properties without current config
     
-    # Use type-aware filename (with backward compatibility)
-    distances_filename = get_type_aware_filename('property_listings_with_distances', property_type, file_suffix)
-    distances_csv = os.path.join(output_dir, distances_filename)
-    
-    # Try type-aware filename first, then old naming for backward compatibility
-    if not os.path.exists(distances_csv) and property_type == 'rental':
-        old_distances_csv = os.path.join(output_dir, f'property_listings_with_distances{file_suffix}.csv')
-        if os.path.exists(old_distances_csv):
-            distances_csv = old_distances_csv
+    # Type-aware filename, falling back to the old rental naming (resolved once per run)
+    distances_csv, distances_stat = _resolve_distances_path(output_dir, file_suffix, property_type)
     
     too_far_finnkodes = set()
     
-    if not os.path.exists(distances_csv):
+    if distances_stat is None:
         return too_far_finnkodes  # No existing data
     
     try:
-        df = pd.read_csv(distances_csv)
+        df = read_distances_table(
+            distances_csv,
+            usecols=('link', 'transit_time_work_minutes', 'work_lat', 'work_lng')
+        )
         
         # Check if work_lat/work_lng columns exist (backward compatibility)
+        # No work location stored - can't verify if location matches, so don't skip anything
         has_work_location = 'work_lat' in df.columns and 'work_lng' in df.columns
+        if not has_work_location or 'link' not in df.columns or 'transit_time_work_minutes' not in df.columns:
+            return too_far_finnkodes
         
-        for _, row in df.iterrows():
-            link = row.get('link')
-            if not link:
-                continue
-            
-            finnkode = extract_finnkode(link)
-            if not finnkode:
-                continue
-            
-            # Check if property was too far away
-            transit_time = row.get('transit_time_work_minutes')
-            if pd.isna(transit_time):
-                continue  # No transit time data, can't determine if too far
-            
-            if transit_time <= current_max_travel_time:
-                continue  # Property was within limit, don't skip
-            
-            # Property exceeded limit - check if work location matches
-            if has_work_location:
-                prev_work_lat = row.get('work_lat')
-                prev_work_lng = row.get('work_lng')
-                
-                if work_location_matches(prev_work_lat, prev_work_lng, current_work_lat, current_work_lng):
-                    # Work location matches - this property was too far and should be skipped
-                    too_far_finnkodes.add(finnkode)
-            else:
-                # No work location stored - can't verify if location matches
-                # For backward compatibility, don't skip (process the property)
-                pass
+        # Too far = exceeded the current limit (missing transit time can't be judged, NaN > x is False)
+        # and was measured against the same work location
+        transit_times = pd.to_numeric(df['transit_time_work_minutes'], errors='coerce')
+        too_far_mask = (
+            df['link'].notna() &
+            (transit_times > current_max_travel_time) &
+            work_location_matches_vec(df['work_lat'], df['work_lng'], current_work_lat, current_work_lng)
+        )
+        
+        # Only the matching rows need a finnkode
+        too_far_finnkodes = set(extract_finnkodes(df.loc[too_far_mask, 'link']).dropna().astype(str))
         
     except Exception as e:
         logger.warning(f"Could not load too far properties from {distances_csv}: {e}")
@@ -547,9 +1398,9 @@ def calculate_distance_to_work(property_lat, property_lng, work_lat, work_lng, m
     if not client:
         raise ValueError("Google Maps client not initialized. Check GOOGLE_API_KEY.")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    logger.debug(f"Distance Matrix API call - Mode: {mode}, From: ({property_lat}, {property_lng}), To: ({work_lat}, {work_lng})")
+    logger.debug("Distance Matrix API call - Mode: %s, From: (%s, %s), To: (%s, %s)", mode, property_lat, property_lng, work_lat, work_lng)
     
     try:
         result = make_api_call_with_retry(
@@ -562,7 +1413,7 @@ def calculate_distance_to_work(property_lat, property_lng, work_lat, work_lng, m
         )
         
         if result is None:
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             logger.error(f"Distance Matrix API call failed after retries (elapsed: {elapsed_time:.2f}s)")
             return {
                 'distance_km': None,
@@ -597,7 +1448,7 @@ def calculate_distance_to_work(property_lat, property_lng, work_lat, work_lng, m
             }
             
     except Exception as e:
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.error(f"Distance Matrix API call failed after {elapsed_time:.2f}s: {str(e)}", exc_info=True)
         return {
             'distance_km': None,
@@ -606,9 +1457,206 @@ def calculate_distance_to_work(property_lat, property_lng, work_lat, work_lng, m
         }
 
 
-# ================================================
-# PLACE SEARCH FUNCTIONS
-# ================================================
+# Distance Matrix API accepts at most 25 origins and 25 destinations per request
+DISTANCE_MATRIX_MAX_ORIGINS = 25
+DISTANCE_MATRIX_MAX_DESTINATIONS = 25
+
+# Origins are snapped to this many decimals (~11 m) before work-distance lookups,
+# so properties at the same address share one Distance Matrix origin
+ORIGIN_SNAP_DECIMALS = 4
+
+
+def calculate_distances_batch(coords_list, work_lat, work_lng, mode='transit', gmaps_client=None, batch_size=DISTANCE_MATRIX_MAX_ORIGINS):
+    """
+    Calculates travel distance and time from many properties to the work location,
+    sending up to batch_size origins per Distance Matrix request.
+    
+    Args:
+        coords_list: List of (lat, lng) tuples for the properties
+        work_lat: Work location latitude
+        work_lng: Work location longitude
+        mode: Travel mode (default: 'transit')
+        gmaps_client: Google Maps client (defaults to module-level client)
+        batch_size: Origins per request (max 25)
+    
+    Returns:
+        list: One dict per input coordinate, in the same order, with keys
+              'distance_km', 'duration_minutes', 'status' (same shape as calculate_distance_to_work)
+    """
+    client = gmaps_client if gmaps_client else gmaps
+    
+    if not client:
+        raise ValueError("Google Maps client not initialized. Check GOOGLE_API_KEY.")
+    
+    batch_size = max(1, min(batch_size, DISTANCE_MATRIX_MAX_ORIGINS))
+    results = []
+    
+    for chunk_start in range(0, len(coords_list), batch_size):
+        chunk = coords_list[chunk_start:chunk_start + batch_size]
+        start_time = time.perf_counter()
+        
+        logger.debug("Distance Matrix API batch call - Mode: %s, Origins: %d, To: (%s, %s)", mode, len(chunk), work_lat, work_lng)
+        
+        try:
+            result = make_api_call_with_retry(
+                client.distance_matrix,
+                origins=list(chunk),
+                destinations=[(work_lat, work_lng)],
+                mode=mode,
+                units='metric',
+                api_type='distance_matrix'
+            )
+        except Exception as e:
+            elapsed_time = time.perf_counter() - start_time
+            logger.error(f"Distance Matrix API batch call failed after {elapsed_time:.2f}s: {str(e)}", exc_info=True)
+            result = None
+        
+        if result is None:
+            logger.error(f"Distance Matrix API batch call failed after retries ({len(chunk)} origins)")
+            results.extend({'distance_km': None, 'duration_minutes': None, 'status': 'ERROR'} for _ in chunk)
+            continue
+        
+        rows = result.get('rows', [])
+        for i in range(len(chunk)):
+            try:
+                element = rows[i]['elements'][0]
+            except (IndexError, KeyError):
+                results.append({'distance_km': None, 'duration_minutes': None, 'status': 'ERROR'})
+                continue
+            
+            status = element.get('status', 'UNKNOWN')
+            if status == 'OK':
+                distance_km = element['distance']['value'] / 1000.0
+                duration_minutes = element['duration']['value'] / 60.0
+                logger.info(f"Distance Matrix API - Status: OK - Distance: {distance_km:.2f} km, Time: {duration_minutes:.1f} min ({mode})")
+                results.append({'distance_km': distance_km, 'duration_minutes': duration_minutes, 'status': 'OK'})
+            else:
+                logger.warning(f"Distance Matrix API - Status: {status} (route calculation failed)")
+                results.append({'distance_km': None, 'duration_minutes': None, 'status': status})
+    
+    return results
+
+
+# ================================================
+# PLACE SEARCH FUNCTIONS
+# ================================================
+
+# Places queries currently being fetched, keyed like place_query_cache, so concurrent
+# lookups of the same query share one request
+_inflight_place_queries = {}
+_inflight_place_queries_lock = threading.RLock()  # Re-entrant: a done-callback can fire inside the lock
+
+
+def _finish_place_query(query_key, future):
+    """
+    Done-callback for an in-flight Places query: cache a successful result, then
+    stop advertising the query as in flight.
+    
+    Args:
+        query_key: place_query_cache key of the query
+        future: Completed future returning (results, error)
+    """
+    results, error = future.result()
+    if error is None and results is not None:
+        place_query_cache[query_key] = results.get('results') or []
+    with _inflight_place_queries_lock:
+        _inflight_place_queries.pop(query_key, None)
+
+
+def run_place_searches(client, searches, location, radius_meters):
+    """
+    Run several Places API searches around one location concurrently.
+    
+    Each search is an independent, network-bound request, so they are issued on the
+    shared API thread pool (get_api_executor) instead of one after another; the shared
+    rate limiter still caps overall throughput. Outcomes come back in the order of
+    searches, so callers dedupe results exactly as the sequential loop did.
+    
+    Successful responses are kept in place_query_cache per (kind, value, location
+    rounded to ~11 m, radius): a keyword shared by several categories, or repeated
+    between keywords and types, costs one API call per location. A query that is still
+    in flight for another caller is joined instead of being sent a second time.
+    
+    Args:
+        client: Google Maps client
+        searches: List of (kind, value) tuples - ('text', keyword) for a text search,
+                  ('type', place_type) for a nearby search by place type
+        location: (lat, lng) tuple to search around
+        radius_meters: Search radius in meters
+    
+    Returns:
+        tuple: (outcomes, requests_sent)
+            - outcomes: (kind, value, results, error) per search, in input order. results
+              is the API response (None if retries were exhausted), error is the exception
+              the call raised (None on success)
+            - requests_sent: Number of searches this call actually sent to the API
+              (cache hits, repeats and joined in-flight queries are not counted)
+    """
+    def run_one(search):
+        kind, value = search
+        try:
+            if kind == 'text':
+                results = make_api_call_with_retry(
+                    client.places,
+                    query=value,
+                    location=location,
+                    radius=radius_meters,
+                    api_type='places'
+                )
+            else:
+                results = make_api_call_with_retry(
+                    client.places_nearby,
+                    location=location,
+                    radius=radius_meters,
+                    type=value,
+                    api_type='places'
+                )
+            return results, None
+        except Exception as e:
+            return None, e
+    
+    location_key = (round(location[0], 4), round(location[1], 4), radius_meters)
+    query_keys = [(kind, value) + location_key for kind, value in searches]
+    
+    outcomes = {}
+    requests_sent = 0
+    for query_key in query_keys:
+        cached_results = place_query_cache.get(query_key)
+        if cached_results is not None:
+            outcomes[query_key] = ({'results': cached_results}, None)
+    
+    # Only uncached queries go out, each once even if listed twice
+    pending = list(dict.fromkeys(key for key in query_keys if key not in outcomes))
+    if pending:
+        logger.debug("Places API - %d of %d queries served from cache", len(query_keys) - len(pending), len(query_keys))
+        
+        # A query another thread already has in flight is joined rather than sent again
+        futures = []
+        with _inflight_place_queries_lock:
+            for query_key in pending:
+                future = _inflight_place_queries.get(query_key)
+                if future is None:
+                    cached_results = place_query_cache.get(query_key)
+                    if cached_results is not None:
+                        # Finished between the cache check above and taking the lock
+                        outcomes[query_key] = ({'results': cached_results}, None)
+                        continue
+                    future = get_api_executor().submit(run_one, query_key[:2])
+                    requests_sent += 1
+                    _inflight_place_queries[query_key] = future
+                    future.add_done_callback(
+                        lambda done, query_key=query_key: _finish_place_query(query_key, done)
+                    )
+                futures.append((query_key, future))
+        
+        for query_key, future in futures:
+            outcomes[query_key] = future.result()
+    
+    return [
+        (kind, value) + outcomes[query_key]
+        for (kind, value), query_key in zip(searches, query_keys)
+    ], requests_sent
+
 
 def find_nearby_places(property_lat, property_lng, 
                        search_keywords=None, 
@@ -618,13 +1666,17 @@ def find_nearby_places(property_lat, property_lng,
                        gmaps_client=None):
     """
     Searches for nearby places using Google Places API with configurable criteria.
+    
+    Stops issuing searches once min_places_required places and MAX_EXAMPLE_MATCHES
+    example matches have been found, so 'total_found' is then a lower bound rather than
+    an exact count. With min_places_required = 0 every search runs.
     """
     client = gmaps_client if gmaps_client else gmaps
     
     if not client:
         raise ValueError("Google Maps client not initialized. Check GOOGLE_API_KEY.")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     if search_keywords is None:
         search_keywords = DEFAULT_PLACE_SEARCH_KEYWORDS
@@ -635,77 +1687,64 @@ def find_nearby_places(property_lat, property_lng,
     if min_places_required is None:
         min_places_required = DEFAULT_MIN_PLACES_REQUIRED
     
-    logger.debug(f"Places API search - Location: ({property_lat}, {property_lng}), Radius: {radius_meters}m, Keywords: {len(search_keywords)}, Types: {len(place_types)}")
+    logger.debug("Places API search - Location: (%s, %s), Radius: %sm, Keywords: %d, Types: %d",
+                 property_lat, property_lng, radius_meters, len(search_keywords), len(place_types))
     
     try:
         matches = []
         all_place_ids = set()
-        api_calls_made = 0
+        add_place_id = all_place_ids.add  # Bound once, called per new result
         
-        for keyword in search_keywords:
-            try:
-                api_calls_made += 1
-                results = make_api_call_with_retry(
-                    client.places,
-                    query=keyword,
-                    location=(property_lat, property_lng),
-                    radius=radius_meters,
-                    api_type='places'
-                )
-                
-                if results and results.get('results'):
-                    places_found = len(results['results'])
-                    logger.debug(f"Places API (text search '{keyword}') - Found {places_found} places")
-                    for place in results['results']:
-                        place_id = place.get('place_id')
-                        if place_id and place_id not in all_place_ids:
-                            all_place_ids.add(place_id)
-                            place_name = place.get('name', 'Unknown')
-                            matches.append(place_name)
-                elif results is None:
-                    logger.warning(f"Places API (text search '{keyword}') failed after retries")
-                            
-            except Exception as e:
-                logger.warning(f"Places API (text search '{keyword}') failed: {str(e)}")
-                continue
+        # Keyword and type searches run concurrently, one wave of CONFIG['api_workers'] at
+        # a time; results are merged in order. Once enough places are found for a match and
+        # the example list is full, the remaining waves can't change the result
+        searches = [('text', keyword) for keyword in search_keywords]
+        searches += [('type', place_type) for place_type in place_types]
+        wave_size = max(1, CONFIG.get('api_workers', 10))
+        api_calls_made = 0
         
-        for place_type in place_types:
-            try:
-                api_calls_made += 1
-                results = make_api_call_with_retry(
-                    client.places_nearby,
-                    location=(property_lat, property_lng),
-                    radius=radius_meters,
-                    type=place_type,
-                    api_type='places'
-                )
+        for wave_start in range(0, len(searches), wave_size):
+            wave = searches[wave_start:wave_start + wave_size]
+            wave_outcomes, requests_sent = run_place_searches(
+                client, wave, (property_lat, property_lng), radius_meters
+            )
+            api_calls_made += requests_sent
+            
+            for kind, value, results, error in wave_outcomes:
+                search_label = f"text search '{value}'" if kind == 'text' else f"type '{value}'"
+                if error is not None:
+                    logger.warning(f"Places API ({search_label}) failed: {str(error)}")
+                    continue
                 
                 if results and results.get('results'):
-                    places_found = len(results['results'])
-                    logger.debug(f"Places API (type '{place_type}') - Found {places_found} places")
+                    logger.debug("Places API (%s) - Found %d places", search_label, len(results['results']))
                     for place in results['results']:
                         place_id = place.get('place_id')
                         if place_id and place_id not in all_place_ids:
-                            all_place_ids.add(place_id)
-                            place_name = place.get('name', 'Unknown')
-                            matches.append(place_name)
+                            add_place_id(sys.intern(place_id))
+                            # Only the first MAX_EXAMPLE_MATCHES names are kept
+                            if len(matches) < MAX_EXAMPLE_MATCHES:
+                                matches.append(place.get('name', 'Unknown'))
                 elif results is None:
-                    logger.warning(f"Places API (type '{place_type}') failed after retries")
-                            
-            except Exception as e:
-                logger.warning(f"Places API (type '{place_type}') failed: {str(e)}")
-                continue
+                    logger.warning(f"Places API ({search_label}) failed after retries")
+            
+            if (min_places_required > 0 and len(all_place_ids) >= min_places_required
+                    and len(matches) >= MAX_EXAMPLE_MATCHES):
+                skipped_searches = len(searches) - wave_start - len(wave)
+                if skipped_searches:
+                    logger.debug("Places API search - Match found, skipping %d remaining searches", skipped_searches)
+                break
         
-        total_found = len(matches)
+        total_found = len(all_place_ids)
         has_match = total_found >= min_places_required
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         logger.info(f"Places API search completed - {total_found} unique places found in {elapsed_time:.2f}s ({api_calls_made} API calls) - Match: {has_match}")
         
         if total_found > 0:
             return {
                 'has_match': has_match,
-                'matches': matches[:10],
+                'matches': matches,
                 'total_found': total_found,
                 'status': 'OK'
             }
@@ -719,7 +1758,7 @@ def find_nearby_places(property_lat, property_lng,
             }
             
     except Exception as e:
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.error(f"Places API search failed after {elapsed_time:.2f}s: {str(e)}", exc_info=True)
         return {
             'has_match': False,
@@ -732,9 +1771,11 @@ def find_nearby_places(property_lat, property_lng,
 def find_nearest_place_in_category(property_lat, property_lng, category_name, category_config, radius_meters=None, gmaps_client=None):
     """
     Finds the nearest place matching a category's keywords.
-    """
-    global place_search_cache
     
+    The Places text searches are run once per ~500 m grid cell (from the cell centre)
+    and the candidate list is cached; the nearest candidate is then chosen by
+    haversine distance from this property's exact coordinates.
+    """
     client = gmaps_client if gmaps_client else gmaps
     
     if not client:
@@ -743,83 +1784,134 @@ def find_nearest_place_in_category(property_lat, property_lng, category_name, ca
     if radius_meters is None:
         radius_meters = DEFAULT_PLACE_SEARCH_RADIUS_METERS
     
-    cache_key = (round(property_lat, 4), round(property_lng, 4), category_name, radius_meters)
-    if cache_key in place_search_cache:
-        logger.debug(f"Places API (category '{category_name}') - Cache hit, skipping API call")
-        return place_search_cache[cache_key]
+    bucket = get_place_search_bucket(property_lat, property_lng)
+    cache_key = (bucket, category_name, radius_meters)
     
-    start_time = time.time()
-    keywords = category_config.get('keywords', [])
-    all_places = []
-    all_place_ids = set()
+    start_time = time.perf_counter()
     api_calls_made = 0
     
-    logger.debug(f"Places API (category '{category_name}') - Searching with {len(keywords)} keywords")
-    
     try:
-        for keyword in keywords:
-            try:
-                api_calls_made += 1
-                results = make_api_call_with_retry(
-                    client.places,
-                    query=keyword,
-                    location=(property_lat, property_lng),
-                    radius=radius_meters,
-                    api_type='places'
-                )
+        keywords = category_config.get('keywords', ())
+        
+        # Single get(): another thread's insert could evict between a membership test and a read
+        candidates = place_search_cache.get(cache_key)
+        
+        if candidates is None:
+            # Only needed on an in-memory miss (disk lookup, and the store after a fresh search)
+            disk_cache_key = get_place_cache_key(
+                bucket, category_name, radius_meters,
+                category_config.get('keywords_key', keywords)
+            )
+            candidates = load_cached_place_search(disk_cache_key)
+            if candidates is not None:
+                logger.debug("Places API (category '%s') - On-disk cache hit for grid cell %s", category_name, bucket)
+                place_search_cache[cache_key] = candidates
+        
+        if candidates is not None:
+            logger.debug("Places API (category '%s') - Cache hit for grid cell %s, skipping API call", category_name, bucket)
+        else:
+            search_location = (bucket[0] / PLACE_SEARCH_GRID_DIVISOR, bucket[1] / PLACE_SEARCH_GRID_DIVISOR)
+            candidates = []
+            all_place_ids = set()
+            add_place_id = all_place_ids.add  # Bound once, called per new result
+            search_complete = True  # Only complete searches are persisted to disk
+            
+            logger.debug("Places API (category '%s') - Searching grid cell %s with %d keywords", category_name, bucket, len(keywords))
+            
+            # The category's keyword searches run concurrently; results are merged in keyword order
+            keyword_outcomes, requests_sent = run_place_searches(
+                client, [('text', keyword) for keyword in keywords], search_location, radius_meters
+            )
+            api_calls_made += requests_sent
+            for _, keyword, results, error in keyword_outcomes:
+                if error is not None:
+                    search_complete = False
+                    logger.warning(f"Places API (category '{category_name}', keyword '{keyword}') failed: {str(error)}")
+                    continue
                 
                 if results and results.get('results'):
                     for place in results['results']:
                         place_id = place.get('place_id')
                         if place_id and place_id not in all_place_ids:
-                            all_place_ids.add(place_id)
+                            # Interned: the same ID recurs across keywords, cells and
+                            # categories, and the candidate lists then share one string
+                            place_id = sys.intern(place_id)
+                            add_place_id(place_id)
                             
-                            location = place.get('geometry', {}).get('location', {})
-                            place_lat = location.get('lat')
-                            place_lng = location.get('lng')
+                            # EAFP: geometry.location is present on virtually every result,
+                            # so index directly instead of allocating {} defaults per place
+                            try:
+                                location = place['geometry']['location']
+                                place_lat = location['lat']
+                                place_lng = location['lng']
+                            except (KeyError, TypeError):
+                                continue
                             
                             if place_lat and place_lng:
-                                distance_km = haversine_distance(
-                                    property_lat, property_lng,
-                                    place_lat, place_lng
-                                )
-                                
-                                all_places.append({
-                                    'name': place.get('name', 'Unknown'),
-                                    'lat': place_lat,
-                                    'lng': place_lng,
-                                    'place_id': place_id,
-                                    'distance_km': distance_km
-                                })
+                                candidates.append(PlaceCandidate(
+                                    place.get('name', 'Unknown'), place_lat, place_lng, place_id
+                                ))
                 elif results is None:
+                    search_complete = False
                     logger.warning(f"Places API (category '{category_name}', keyword '{keyword}') failed after retries")
-                
-            except Exception as e:
-                logger.warning(f"Places API (category '{category_name}', keyword '{keyword}') failed: {str(e)}")
-                continue
+            
+            place_search_cache[cache_key] = candidates
+            if search_complete:
+                store_cached_place_search(disk_cache_key, candidates)
         
-        if not all_places:
-            elapsed_time = time.time() - start_time
+        if not candidates:
+            elapsed_time = time.perf_counter() - start_time
             logger.info(f"Places API (category '{category_name}') - No places found in {elapsed_time:.2f}s ({api_calls_made} API calls)")
             result = None
         else:
-            nearest = min(all_places, key=lambda x: x['distance_km'])
-            elapsed_time = time.time() - start_time
-            logger.info(f"Places API (category '{category_name}') - Found nearest: {nearest['name']} ({nearest['distance_km']:.2f} km) in {elapsed_time:.2f}s ({api_calls_made} API calls)")
+            # Distances are always measured from this property, not the grid cell -
+            # one vectorized pass over all candidates, then take the closest
+            if len(candidates) < HAVERSINE_VEC_MIN_POINTS:
+                # A few points: inlined math with the property's terms hoisted out of the
+                # loop is cheaper than building NumPy arrays or a call per candidate
+                phi0 = radians(property_lat)
+                lam0 = radians(property_lng)
+                cos_phi0 = cos(phi0)
+                # Running minimum - no per-candidate distance list or second min() pass
+                nearest_pos = 0
+                nearest_km = float('inf')
+                for pos, place in enumerate(candidates):
+                    phi = radians(place.lat)
+                    # Bounding-box check: the great-circle distance is never shorter than
+                    # the north-south arc, so a candidate whose latitude alone puts it at
+                    # least as far as the current best can't win - skip the full formula
+                    if 6371.0 * abs(phi0 - phi) >= nearest_km:
+                        continue
+                    a = sin((phi0 - phi) / 2)**2 + cos(phi) * cos_phi0 * sin((lam0 - radians(place.lng)) / 2)**2
+                    distance_km = 2 * 6371.0 * asin(sqrt(a))
+                    if distance_km < nearest_km:  # Strict: ties keep the first candidate
+                        nearest_pos = pos
+                        nearest_km = distance_km
+            else:
+                distances_km = haversine_km_vec(
+                    [place.lat for place in candidates],
+                    [place.lng for place in candidates],
+                    property_lat, property_lng
+                )
+                nearest_pos = int(np.argmin(distances_km))
+                nearest_km = float(distances_km[nearest_pos])
+            # A copy: the candidate itself is shared through the place caches
+            nearest = replace(candidates[nearest_pos], distance_km=nearest_km)
+            elapsed_time = time.perf_counter() - start_time
+            logger.info(f"Places API (category '{category_name}') - Found nearest: {nearest.name} ({nearest.distance_km:.2f} km) in {elapsed_time:.2f}s ({api_calls_made} API calls)")
             result = {
-                'name': nearest['name'],
-                'lat': nearest['lat'],
-                'lng': nearest['lng'],
-                'place_id': nearest['place_id'],
-                'distance_km': nearest['distance_km'],
+                'name': nearest.name,
+                'lat': nearest.lat,
+                'lng': nearest.lng,
+                'place_id': nearest.place_id,
+                'distance_km': nearest.distance_km,
                 'status': 'OK'
             }
         
-        place_search_cache[cache_key] = result
         return result
         
     except Exception as e:
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.error(f"Places API (category '{category_name}') failed after {elapsed_time:.2f}s: {str(e)}", exc_info=True)
         return None
 
@@ -827,73 +1919,139 @@ def find_nearest_place_in_category(property_lat, property_lng, category_name, ca
 def calculate_travel_time_to_place(property_lat, property_lng, place_lat, place_lng, modes=['walking'], gmaps_client=None):
     """
     Calculates walking and/or transit time from property to a place using Distance Matrix API.
+    
+    Thin wrapper around calculate_travel_times_to_places for a single place.
+    """
+    return calculate_travel_times_to_places(
+        property_lat, property_lng,
+        [(place_lat, place_lng, list(modes))],
+        gmaps_client=gmaps_client
+    )[0]
+
+
+def calculate_travel_times_to_places(property_lat, property_lng, places, gmaps_client=None):
+    """
+    Calculates travel times from a property to several places using one Distance Matrix API call per mode.
+
+    All places that need a given mode are sent as destinations of the same request
+    (split into chunks of DISTANCE_MATRIX_MAX_DESTINATIONS), so looking up K places
+    costs one call per mode instead of one call per place and mode. Trips already in
+    the on-disk cache (see load_cached_place_travel_times) are not requested again.
+
+    Args:
+        property_lat: Property latitude
+        property_lng: Property longitude
+        places: List of (place_lat, place_lng, modes) tuples, where modes is a list like ['walking', 'transit']
+        gmaps_client: Optional Google Maps client (defaults to module client)
+
+    Returns:
+        list: One result dict per place (same format as calculate_travel_time_to_place)
     """
     client = gmaps_client if gmaps_client else gmaps
-    
+
     if not client:
         raise ValueError("Google Maps client not initialized. Check GOOGLE_API_KEY.")
-    
-    start_time = time.time()
-    result = {
-        'walking_minutes': None,
-        'transit_minutes': None,
-        'status': 'ERROR'
+
+    start_time = time.perf_counter()
+    results = [{'walking_minutes': None, 'transit_minutes': None, 'status': 'ERROR'} for _ in places]
+    successful_modes = [0] * len(places)
+
+    # Serve trips already in the on-disk cache; only the remaining modes go to the API
+    cache_keys = {
+        (i, mode): get_place_travel_time_cache_key(property_lat, property_lng, place_lat, place_lng, mode)
+        for i, (place_lat, place_lng, modes) in enumerate(places)
+        for mode in modes
     }
-    
-    successful_modes = 0
-    api_calls_made = 0
-    
-    logger.debug(f"Distance Matrix API (to place) - Modes: {modes}, From: ({property_lat}, {property_lng}), To: ({place_lat}, {place_lng})")
-    
-    for mode in modes:
+    cached_minutes = load_cached_place_travel_times(cache_keys.values())
+    pending_modes = []
+    for i, (_, _, modes) in enumerate(places):
+        remaining_modes = []
+        for mode in modes:
+            duration_minutes = cached_minutes.get(cache_keys[(i, mode)])
+            if duration_minutes is None:
+                remaining_modes.append(mode)
+            else:
+                results[i][f'{mode}_minutes'] = duration_minutes
+                successful_modes[i] += 1
+        pending_modes.append(remaining_modes)
+    new_cache_entries = []
+
+    all_modes = []
+    for modes in pending_modes:
+        for mode in modes:
+            if mode not in all_modes:
+                all_modes.append(mode)
+
+    logger.debug("Distance Matrix API (to places) - Modes: %s, From: (%s, %s), Destinations: %d", all_modes, property_lat, property_lng, len(places))
+
+    # One request per mode, split into chunks of at most DISTANCE_MATRIX_MAX_DESTINATIONS
+    requests = []
+    for mode in all_modes:
+        mode_indices = [i for i, modes in enumerate(pending_modes) if mode in modes]
+        for chunk_start in range(0, len(mode_indices), DISTANCE_MATRIX_MAX_DESTINATIONS):
+            requests.append((mode, mode_indices[chunk_start:chunk_start + DISTANCE_MATRIX_MAX_DESTINATIONS]))
+
+    def call_distance_matrix(request):
+        mode, place_indices = request
         try:
-            api_calls_made += 1
             api_result = make_api_call_with_retry(
                 client.distance_matrix,
                 origins=[(property_lat, property_lng)],
-                destinations=[(place_lat, place_lng)],
+                destinations=[(places[i][0], places[i][1]) for i in place_indices],
                 mode=mode,
                 units='metric',
                 api_type='distance_matrix'
             )
-            
+            return api_result, None
+        except Exception as e:
+            return None, e
+
+    # Modes (and chunks) are independent requests - run them concurrently and parse the
+    # responses here, so results are only ever written from this thread
+    api_calls_made = len(requests)
+    if len(requests) > 1:
+        responses = list(get_api_executor().map(call_distance_matrix, requests))
+    else:
+        responses = [call_distance_matrix(request) for request in requests]
+
+    for (mode, place_indices), (api_result, error) in zip(requests, responses):
+        if error is not None:
+            logger.warning(f"Distance Matrix API ({mode}) call failed: {str(error)}")
+            continue
+
+        try:
             if api_result and 'rows' in api_result:
-                element = api_result['rows'][0]['elements'][0]
-                status = element.get('status', 'UNKNOWN')
-                
-                if status == 'OK':
-                    duration_seconds = element['duration']['value']
-                    duration_minutes = duration_seconds / 60.0
-                    
-                    if mode == 'walking':
-                        result['walking_minutes'] = duration_minutes
-                        logger.debug(f"Distance Matrix API ({mode}) - {duration_minutes:.1f} minutes")
-                    elif mode == 'transit':
-                        result['transit_minutes'] = duration_minutes
-                        logger.debug(f"Distance Matrix API ({mode}) - {duration_minutes:.1f} minutes")
-                    
-                    successful_modes += 1
-                else:
-                    logger.warning(f"Distance Matrix API ({mode}) - Status: {status}")
+                elements = api_result['rows'][0]['elements']
+                for place_index, element in zip(place_indices, elements):
+                    status = element.get('status', 'UNKNOWN')
+
+                    if status == 'OK':
+                        duration_minutes = element['duration']['value'] / 60.0
+                        results[place_index][f'{mode}_minutes'] = duration_minutes
+                        successful_modes[place_index] += 1
+                        new_cache_entries.append((cache_keys[(place_index, mode)], duration_minutes))
+                        logger.debug("Distance Matrix API (%s) - %.1f minutes", mode, duration_minutes)
+                    else:
+                        logger.warning(f"Distance Matrix API ({mode}) - Status: {status}")
             elif api_result is None:
                 logger.warning(f"Distance Matrix API ({mode}) call failed after retries")
-            
+
         except Exception as e:
-            logger.warning(f"Distance Matrix API ({mode}) call failed: {str(e)}")
+            logger.warning(f"Distance Matrix API ({mode}) response could not be parsed: {str(e)}")
             continue
-    
-    elapsed_time = time.time() - start_time
-    if successful_modes == len(modes):
-        result['status'] = 'OK'
-        logger.debug(f"Distance Matrix API (to place) - All modes successful in {elapsed_time:.2f}s ({api_calls_made} API calls)")
-    elif successful_modes > 0:
-        result['status'] = 'PARTIAL'
-        logger.warning(f"Distance Matrix API (to place) - Partial success: {successful_modes}/{len(modes)} modes in {elapsed_time:.2f}s")
-    else:
-        result['status'] = 'ERROR'
-        logger.error(f"Distance Matrix API (to place) - All modes failed in {elapsed_time:.2f}s")
-    
-    return result
+
+    store_cached_place_travel_times(new_cache_entries)
+
+    for result, succeeded, (_, _, modes) in zip(results, successful_modes, places):
+        if succeeded == len(modes):
+            result['status'] = 'OK'
+        elif succeeded > 0:
+            result['status'] = 'PARTIAL'
+
+    elapsed_time = time.perf_counter() - start_time
+    logger.debug("Distance Matrix API (to places) - %d destinations in %.2fs (%d API calls)", len(places), elapsed_time, api_calls_made)
+
+    return results
 
 
 # ============================================
@@ -912,7 +2070,7 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     5. Saves results to CSV files
     
     Args:
-        args: Argument object with configuration attributes:
+        args: Argument object (or DistanceConfig) with configuration attributes:
             - max_transit_time_work: Maximum travel time to work in minutes (default: 60)
             - test_mode: Whether to limit properties processed (default: False)
             - test_limit: Number of properties in test mode (default: 20)
@@ -924,42 +2082,54 @@ def calculate_distances_and_filter(args, input_csv_path=None):
             - place_keywords: Custom place keywords (e.g., ['boxing', 'MMA'])
             - place_types: Custom place types (e.g., ['gym'])
             - property_type: 'rental' or 'sales' (default: 'rental')
+            - run_smoke_test: Make one test Distance Matrix call before processing (default: False)
         input_csv_path: Path to input CSV with coordinates (defaults to type-aware property_listings_with_coordinates.csv)
     
     Returns:
         str: Path to output CSV file with filtered results
     """
-    global place_search_cache
-    place_search_cache = {}  # Clear cache for new run
-    
-    # Get configuration from args
-    max_travel_time = getattr(args, 'max_transit_time_work', DEFAULT_MAX_TRAVEL_TIME_MINUTES)
-    test_mode = getattr(args, 'test_mode', DEFAULT_TEST_MODE)
-    test_limit = getattr(args, 'test_limit', DEFAULT_TEST_LIMIT)
-    output_dir = getattr(args, 'output_dir', 'output')
-    work_lat = getattr(args, 'work_lat', DEFAULT_WORK_LAT)
-    work_lng = getattr(args, 'work_lng', DEFAULT_WORK_LNG)
-    search_radius = getattr(args, 'search_radius', DEFAULT_PLACE_SEARCH_RADIUS_METERS)
-    facility_keywords = getattr(args, 'facility_keywords', None)
-    place_keywords = getattr(args, 'place_keywords', None)
-    place_types = getattr(args, 'place_types', None)
-    file_suffix = getattr(args, 'file_suffix', '')
-    property_type = getattr(args, 'property_type', 'rental')  # Get property_type from args
-    
-    # Ensure output_dir is an absolute path
-    if not os.path.isabs(output_dir):
-        output_dir = os.path.join(script_dir, output_dir)
+    place_search_cache.clear()  # Clear cache for new run
+    
+    # Get configuration from args (resolved once into a frozen config)
+    cfg = DistanceConfig.from_args(args)
+    max_travel_time = cfg.max_transit_time_work
+    test_mode = cfg.test_mode
+    test_limit = cfg.test_limit
+    output_dir = cfg.output_dir
+    work_lat = cfg.work_lat
+    work_lng = cfg.work_lng
+    search_radius = cfg.search_radius
+    facility_keywords = cfg.facility_keywords
+    place_keywords = cfg.place_keywords
+    place_types = cfg.place_types
+    file_suffix = cfg.file_suffix
+    property_type = cfg.property_type
+    
+    # Resolve output_dir once (relative paths are relative to the script directory) and
+    # create it up front, so every file path below is a cheap Path composition and the
+    # only filesystem hits are the .exists() checks that actually matter.
+    output_path = Path(output_dir)
+    if not output_path.is_absolute():
+        output_path = Path(script_dir) / output_path
+    output_path = output_path.resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
+    output_dir = str(output_path)  # Helpers below still take a plain directory string
+    
+    # Files in output_dir may have changed since the previous run in this process
+    _resolve_distances_path.cache_clear()
     
     # Determine input CSV path (type-aware)
     if input_csv_path is None:
         # Use type-aware filename for coordinates file
         coords_filename = get_type_aware_filename('property_listings_with_coordinates', property_type, file_suffix)
-        input_csv_path = os.path.join(output_dir, coords_filename)
+        input_csv_path = output_path / coords_filename
         # Fallback to old naming for backward compatibility (rental only)
-        if not os.path.exists(input_csv_path) and property_type == 'rental':
-            old_input_csv_path = os.path.join(output_dir, f'property_listings_with_coordinates{file_suffix}.csv')
-            if os.path.exists(old_input_csv_path):
+        old_input_csv_path = output_path / f'property_listings_with_coordinates{file_suffix}.csv'
+        if property_type == 'rental' and old_input_csv_path != input_csv_path and not input_csv_path.exists():
+            if old_input_csv_path.exists():
                 input_csv_path = old_input_csv_path
+    else:
+        input_csv_path = Path(input_csv_path)
     
     # Initialize Google Maps client
     if not GOOGLE_API_KEY:
@@ -967,15 +2137,16 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     
     gmaps_client = googlemaps.Client(key=GOOGLE_API_KEY)
     
-    # Build PLACE_CATEGORIES from args
-    place_categories = DEFAULT_PLACE_CATEGORIES.copy()
+    # Build PLACE_CATEGORIES from args (copy each category so overrides don't leak into the defaults)
+    place_categories = {name: dict(settings) for name, settings in DEFAULT_PLACE_CATEGORIES.items()}
     
     # Update with custom keywords if provided
     if facility_keywords:
         # Split into EVO and SATS if possible
-        evo_keywords = [k for k in facility_keywords if 'evo' in k.lower()]
-        sats_keywords = [k for k in facility_keywords if 'sats' in k.lower()]
-        other_facility = [k for k in facility_keywords if 'evo' not in k.lower() and 'sats' not in k.lower()]
+        lowered = [(k, k.lower()) for k in facility_keywords]
+        evo_keywords = tuple(k for k, k_lower in lowered if 'evo' in k_lower)
+        sats_keywords = tuple(k for k, k_lower in lowered if 'sats' in k_lower)
+        other_facility = tuple(k for k, k_lower in lowered if 'evo' not in k_lower and 'sats' not in k_lower)
         
         if evo_keywords:
             place_categories['EVO']['keywords'] = evo_keywords
@@ -983,11 +2154,30 @@ def calculate_distances_and_filter(args, input_csv_path=None):
             place_categories['SATS']['keywords'] = sats_keywords
         if other_facility:
             # Add other facilities to both categories
-            place_categories['EVO']['keywords'].extend(other_facility)
-            place_categories['SATS']['keywords'].extend(other_facility)
+            place_categories['EVO']['keywords'] += other_facility
+            place_categories['SATS']['keywords'] += other_facility
     
     if place_keywords:
-        place_categories['martial_arts']['keywords'] = place_keywords
+        place_categories['martial_arts']['keywords'] = tuple(place_keywords)
+    
+    # Keep the disk-cache key in step with any keyword overrides
+    for settings in place_categories.values():
+        settings['keywords_key'] = '|'.join(sorted(settings['keywords']))
+    
+    # Pre-compute per-category column names once so the per-property loops below
+    # only do a dict lookup instead of rebuilding the same strings every iteration.
+    # cat_meta[cat_name] = (prefix, nearest_col, walking_col, transit_col, calculate_transit)
+    cat_meta = {
+        cat_name: (
+            cat_config['column_prefix'],
+            f"nearest_{cat_config['column_prefix']}",
+            f"walking_time_{cat_config['column_prefix']}_minutes",
+            f"transit_time_{cat_config['column_prefix']}_minutes",
+            cat_config.get('calculate_transit', False)
+        )
+        for cat_name, cat_config in place_categories.items()
+    }
+    walking_cols = [meta[2] for meta in cat_meta.values()]
     
     # Log rate limiting setup
     logger.info("Rate limiting initialized:")
@@ -1008,10 +2198,15 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # ================================================
     
     print(f"📂 Loading CSV: {input_csv_path}")
-    if not os.path.exists(input_csv_path):
+    if not input_csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {input_csv_path}. Please run Stringtocordinates.py first.")
     
-    df = pd.read_csv(input_csv_path)
+    try:
+        df = pd.read_csv(input_csv_path, dtype=GEOCODED_CSV_DTYPES)
+    except ValueError as e:
+        # A stray non-numeric coordinate shouldn't stop the run - let pandas infer instead
+        logger.debug(f"Explicit dtypes failed for {input_csv_path}, re-reading with inferred dtypes: {e}")
+        df = pd.read_csv(input_csv_path)
     
     # Filter to only properties that were successfully geocoded
     df_valid = df[df['geocode_status'] == 'Success'].copy()
@@ -1035,29 +2230,23 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # LOAD EXISTING DISTANCE DATA AND MERGE
     # ================================================
     
-    # Use type-aware filename (with backward compatibility)
-    distances_filename = get_type_aware_filename('property_listings_with_distances', property_type, file_suffix)
-    distances_csv_path = os.path.join(output_dir, distances_filename)
+    # Type-aware filename with backward-compatible fallback; the stat() result cached by
+    # the startup loaders answers both "does it exist" and "is it empty"
+    distances_csv_path, distances_stat = _resolve_distances_path(output_dir, file_suffix, property_type)
     existing_df = None
+    file_size = distances_stat.st_size if distances_stat is not None else None
     
-    # Try type-aware filename first, then old naming for backward compatibility
-    if not os.path.exists(distances_csv_path) and property_type == 'rental':
-        old_distances_csv_path = os.path.join(output_dir, f'property_listings_with_distances{file_suffix}.csv')
-        if os.path.exists(old_distances_csv_path):
-            distances_csv_path = old_distances_csv_path
-    
-    if os.path.exists(distances_csv_path):
+    if file_size is not None:
         # Check if file is empty
-        file_size = os.path.getsize(distances_csv_path)
         if file_size > 0:
             try:
-                existing_df = pd.read_csv(distances_csv_path)
+                existing_df = read_distances_table(distances_csv_path)
                 # Check if dataframe is empty (only has header)
                 if len(existing_df) == 0:
                     existing_df = None  # Treat as no existing data
                 else:
                     tracker.stats['step5_distance_calculation']['existing_in_distances_csv'] = len(existing_df)
-                    print(f"📊 Found {len(existing_df)} existing properties in {os.path.basename(distances_csv_path)}")
+                    print(f"📊 Found {len(existing_df)} existing properties in {distances_csv_path.name}")
                     
                     # ================================================
                     # BACKFILL WORK LOCATION AND MAX_TRANSIT_TIME FOR BACKWARD COMPATIBILITY
@@ -1112,7 +2301,8 @@ def calculate_distances_and_filter(args, input_csv_path=None):
                     
                     # Save updated CSV immediately if backfill was performed
                     if needs_backfill:
-                        existing_df.to_csv(distances_csv_path, index=False, encoding='utf-8')
+                        write_csv(existing_df, distances_csv_path)
+                        write_columnar_copy(existing_df, distances_csv_path)
                         if backfilled_work_location_count > 0:
                             print(f"✅ Backfilled work location for {backfilled_work_location_count} properties (assumed current work location)")
                         if backfilled_max_transit_time_count > 0:
@@ -1126,34 +2316,6 @@ def calculate_distances_and_filter(args, input_csv_path=None):
                 existing_df = None
         else:
             existing_df = None  # Empty file, treat as no existing data
-            
-            # #region agent log
-            # Check if backup file exists and has these properties
-            import json
-            import glob
-            backup_files = glob.glob(os.path.join(output_dir, f'*backup*.csv'))
-            for backup_file in backup_files:
-                if 'sales' in backup_file.lower() and property_type == 'sales':
-                    try:
-                        backup_df = pd.read_csv(backup_file)
-                        target_finnkodes = ['437802416', '442148776', '435383650']
-                        for target_fk in target_finnkodes:
-                            if 'link' in backup_df.columns:
-                                matching = backup_df[backup_df['link'].str.contains(target_fk, na=False)]
-                                if len(matching) > 0:
-                                    with open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a') as f:
-                                        f.write(json.dumps({
-                                            'sessionId': 'debug-session',
-                                            'runId': 'run1',
-                                            'hypothesisId': 'E',
-                                            'location': 'distance_calculator.py:954',
-                                            'message': f'Property {target_fk} found in backup file but main file empty',
-                                            'data': {'finnkode': target_fk, 'backup_file': os.path.basename(backup_file), 'backup_count': len(backup_df)},
-                                            'timestamp': int(time.time() * 1000)
-                                        }) + '\n')
-                    except Exception as e:
-                        pass
-            # #endregion
     else:
         existing_df = None
         tracker.stats['step5_distance_calculation']['existing_in_distances_csv'] = 0
@@ -1165,64 +2327,77 @@ def calculate_distances_and_filter(args, input_csv_path=None):
         # Deduplicate by finnkode, keeping newer data (from df_valid) when duplicates exist
         print(f"🔄 Merging {len(df_valid)} new properties with {len(existing_df)} existing properties...")
         
-        # Ensure both DataFrames have compatible columns
-        # Add missing columns to df_valid from existing_df
-        for col in existing_df.columns:
-            if col not in df_valid.columns:
-                df_valid[col] = None
+        # Ensure both DataFrames have compatible columns: each side gets the other's
+        # missing columns (all None) in one concat instead of one insert per column
+        missing_in_valid = existing_df.columns.difference(df_valid.columns, sort=False)
+        if len(missing_in_valid) > 0:
+            df_valid = pd.concat(
+                [df_valid, pd.DataFrame(None, index=df_valid.index, columns=missing_in_valid, dtype=object)],
+                axis=1
+            )
         
-        # Add missing columns to existing_df from df_valid
-        for col in df_valid.columns:
-            if col not in existing_df.columns:
-                existing_df[col] = None
+        missing_in_existing = df_valid.columns.difference(existing_df.columns, sort=False)
+        if len(missing_in_existing) > 0:
+            existing_df = pd.concat(
+                [existing_df, pd.DataFrame(None, index=existing_df.index, columns=missing_in_existing, dtype=object)],
+                axis=1
+            )
         
         # Extract finnkode for deduplication (use finnkode instead of link for reliable matching)
         df_valid['_finnkode'] = df_valid['link'].apply(extract_finnkode)
         existing_df['_finnkode'] = existing_df['link'].apply(extract_finnkode)
         
         # Store original date_read from existing_df before merge (to preserve first processing date)
+        # Built from column arrays; dict() keeps the last row for a repeated finnkode
         original_date_read = {}
         if 'date_read' in existing_df.columns:
-            for _, row in existing_df.iterrows():
-                finnkode = row.get('_finnkode')
-                date_read = row.get('date_read')
-                if finnkode and not pd.isna(date_read):
-                    original_date_read[finnkode] = date_read
+            existing_finnkodes = existing_df['_finnkode'].to_numpy()
+            existing_dates = existing_df['date_read'].to_numpy()
+            has_date = pd.notna(existing_finnkodes) & pd.notna(existing_dates)
+            original_date_read = dict(zip(existing_finnkodes[has_date], existing_dates[has_date]))
         
         # Create a map of finnkodes to new coordinate data
-        new_coords_map = {}
-        for _, row in df_valid.iterrows():
-            finnkode = row.get('_finnkode')
-            if finnkode and (pd.notna(row.get('latitude')) or pd.notna(row.get('longitude'))):
-                new_coords_map[finnkode] = {
-                    'latitude': row.get('latitude'),
-                    'longitude': row.get('longitude'),
-                    'geocode_status': row.get('geocode_status')
-                }
+        new_finnkodes = df_valid['_finnkode'].to_numpy()
+        new_lats = df_valid['latitude'].to_numpy()
+        new_lngs = df_valid['longitude'].to_numpy()
+        new_statuses = df_valid['geocode_status'].to_numpy()
+        has_coords = pd.notna(new_finnkodes) & (pd.notna(new_lats) | pd.notna(new_lngs))
+        new_coords_map = {
+            finnkode: {'latitude': lat, 'longitude': lng, 'geocode_status': status}
+            for finnkode, lat, lng, status in zip(
+                new_finnkodes[has_coords], new_lats[has_coords], new_lngs[has_coords], new_statuses[has_coords]
+            )
+        }
         
         # Concatenate and deduplicate by finnkode (keep first = existing data with distance calculations)
-        # We keep 'first' (existing_df) to preserve distance data
-        combined = pd.concat([existing_df, df_valid], ignore_index=True)
-        df_valid = combined.drop_duplicates(subset=['_finnkode'], keep='first')
+        # We keep 'first' (existing_df) to preserve distance data. The duplicate check runs on
+        # the finnkode column alone, so only the surviving rows of each frame are concatenated
+        # (same rows and row labels as concat + drop_duplicates, without the 2N-row frame)
+        keep = ~pd.concat(
+            [existing_df['_finnkode'], df_valid['_finnkode']], ignore_index=True
+        ).duplicated(keep='first').to_numpy()
+        existing_count = len(existing_df)
+        df_valid = pd.concat(
+            [existing_df[keep[:existing_count]], df_valid[keep[existing_count:]]], ignore_index=True
+        )
+        df_valid.index = np.flatnonzero(keep)
         
         # Update coordinates from new data if they're missing in existing data
-        for idx, row in df_valid.iterrows():
-            finnkode = row.get('_finnkode')
-            if finnkode and finnkode in new_coords_map:
-                new_coords = new_coords_map[finnkode]
-                if pd.isna(row.get('latitude')) and pd.notna(new_coords['latitude']):
-                    df_valid.at[idx, 'latitude'] = new_coords['latitude']
-                if pd.isna(row.get('longitude')) and pd.notna(new_coords['longitude']):
-                    df_valid.at[idx, 'longitude'] = new_coords['longitude']
-                if pd.isna(row.get('geocode_status')) and pd.notna(new_coords.get('geocode_status')):
-                    df_valid.at[idx, 'geocode_status'] = new_coords['geocode_status']
+        # (one finnkode -> value map per column, applied where the merged row has a gap)
+        if new_coords_map:
+            new_coords = pd.DataFrame.from_dict(new_coords_map, orient='index')
+            for col in ('latitude', 'longitude', 'geocode_status'):
+                new_values = df_valid['_finnkode'].map(new_coords[col])
+                fill = df_valid[col].isna() & new_values.notna()
+                if fill.any():
+                    df_valid.loc[fill, col] = new_values[fill]
         
         # Restore original date_read for properties that already existed (preserve first processing date)
-        if 'date_read' in df_valid.columns:
-            for idx, row in df_valid.iterrows():
-                finnkode = row.get('_finnkode')
-                if finnkode and finnkode in original_date_read:
-                    df_valid.at[idx, 'date_read'] = original_date_read[finnkode]
+        if 'date_read' in df_valid.columns and original_date_read:
+            restored_dates = df_valid['_finnkode'].map(original_date_read)
+            has_original = restored_dates.notna()
+            if has_original.any():
+                df_valid.loc[has_original, 'date_read'] = restored_dates[has_original]
         
         # Remove temporary finnkode column
         df_valid = df_valid.drop(columns=['_finnkode'], errors='ignore')
@@ -1239,46 +2414,49 @@ def calculate_distances_and_filter(args, input_csv_path=None):
         print()
     
     # Load existing distance data as dictionary for quick lookup
-    existing_data = load_existing_distance_data(output_dir, file_suffix, property_type)
+    existing_data = load_existing_distance_data(output_dir, file_suffix, property_type, place_categories)
     if existing_data:
         print(f"📊 Found {len(existing_data)} properties with existing distance data for lookup")
     
     # Apply existing data to the dataframe and check completion status
-    completed_count = 0
-    incomplete_indices = []
+    # (column-wise: one finnkode extraction pass and one masked assignment per column)
+    finnkodes = extract_finnkodes(df_valid['link'])
+    finnkode_by_idx = {idx: finnkode for idx, finnkode in zip(df_valid.index, finnkodes.tolist()) if not pd.isna(finnkode)}
     
-    for idx, row in df_valid.iterrows():
-        link = row.get('link')
-        
-        # Extract finnkode from link and use it to match existing data
-        finnkode = None
-        if link:
-            finnkode = extract_finnkode(link)
-        
-        # Apply existing data if available (match by finnkode instead of link)
-        if finnkode and finnkode in existing_data:
-            existing_row = existing_data[finnkode]
-            for col, val in existing_row.items():
+    if existing_data:
+        # Match by finnkode instead of link
+        existing_lookup = pd.DataFrame.from_dict(existing_data, orient='index')
+        matched = finnkodes.isin(existing_lookup.index).to_numpy()
+        if matched.any():
+            matched_index = df_valid.index[matched]
+            existing_rows = existing_lookup.loc[finnkodes[matched].tolist()]
+            existing_rows.index = matched_index
+            for col in existing_lookup.columns:
+                existing_values = existing_rows[col]
                 if col not in df_valid.columns:
-                    df_valid.at[idx, col] = val
-                elif pd.isna(df_valid.at[idx, col]) and not pd.isna(val):
-                    df_valid.at[idx, col] = val
-                elif col == 'date_read' and not pd.isna(val):
-                    # Preserve original date_read from existing data when property already processed
-                    # This ensures date_read reflects when property was first processed, not re-processed
-                    df_valid.at[idx, col] = val
-        
-        # Check completion status
-        status = check_property_completion_status(df_valid.loc[idx], place_categories)
-        df_valid.at[idx, 'processing_status'] = status
-        
-        if status == 'completed':
-            completed_count += 1
-            if finnkode:
-                logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: ✅ SKIPPED (already fully processed)")
-        else:
-            incomplete_indices.append(idx)
-            # Don't log here - we'll log after checking if distance data exists
+                    df_valid[col] = existing_values
+                    continue
+                has_value = existing_values.notna()
+                if col != 'date_read':
+                    # Only fill gaps - current data wins where both have a value
+                    has_value &= df_valid.loc[matched_index, col].isna()
+                # date_read: the existing value always wins, so it reflects when the
+                # property was first processed, not when it was re-processed
+                fill_index = matched_index[has_value.to_numpy()]
+                if len(fill_index) > 0:
+                    df_valid.loc[fill_index, col] = existing_values[fill_index]
+    
+    # Check completion status for all properties in one vectorized pass
+    completed_mask = get_completion_mask(df_valid, place_categories)
+    df_valid['processing_status'] = get_processing_status(completed_mask)
+    completed_count = int(completed_mask.sum())
+    # Incomplete properties: don't log here - we'll log after checking if distance data exists
+    incomplete_indices = df_valid.index[~completed_mask.to_numpy()].tolist()
+    
+    for idx in df_valid.index[completed_mask.to_numpy()]:
+        finnkode = finnkode_by_idx.get(idx)
+        if finnkode:
+            logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: ✅ SKIPPED (already fully processed)")
     
     print(f"✅ Already fully completed: {completed_count} properties (will skip)")
     print(f"📍 Incomplete properties: {len(incomplete_indices)} properties")
@@ -1305,7 +2483,7 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     warning_threshold_places = int(max_places_calls * api_safety['warning_threshold_percent'] / 100)
     
     # Record start time for total execution timing
-    script_start_time = time.time()
+    script_start_time = time.perf_counter()
     
     # Log API statistics at start
     logger.info("="*70)
@@ -1320,34 +2498,37 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # TEST DISTANCE CALCULATION
     # ================================================
     
-    print("="*70)
-    print("TESTING DISTANCE CALCULATION FUNCTION")
-    print("="*70)
-    
-    if len(df_valid) > 0:
-        test_property = df_valid.iloc[0]
-        test_lat = test_property['latitude']
-        test_lng = test_property['longitude']
-        test_address = test_property['address']
-        
-        print(f"\nTesting with property: {test_address}")
-        print(f"Property coordinates: ({test_lat}, {test_lng})")
-        print(f"Work coordinates: ({work_lat}, {work_lng})")
-        print("\nCalculating distance...")
-        
-        result = calculate_distance_to_work(
-            test_lat, test_lng, work_lat, work_lng,
-            mode='transit', gmaps_client=gmaps_client
-        )
+    # One real Distance Matrix call as a diagnostic - opt-in (--run-smoke-test), since it
+    # spends quota and waits on the API before any real work starts
+    if cfg.run_smoke_test:
+        print("="*70)
+        print("TESTING DISTANCE CALCULATION FUNCTION")
+        print("="*70)
         
-        if result['status'] == 'OK':
-            print(f"✅ Success!")
-            print(f"   Distance: {result['distance_km']:.2f} km")
-            print(f"   Travel time: {result['duration_minutes']:.1f} minutes by public transport")
+        if len(df_valid) > 0:
+            test_index = df_valid.index[0]
+            test_lat = df_valid.at[test_index, 'latitude']
+            test_lng = df_valid.at[test_index, 'longitude']
+            test_address = df_valid.at[test_index, 'address']
+            
+            print(f"\nTesting with property: {test_address}")
+            print(f"Property coordinates: ({test_lat}, {test_lng})")
+            print(f"Work coordinates: ({work_lat}, {work_lng})")
+            print("\nCalculating distance...")
+            
+            result = calculate_distance_to_work(
+                test_lat, test_lng, work_lat, work_lng,
+                mode='transit', gmaps_client=gmaps_client
+            )
+            
+            if result['status'] == 'OK':
+                print(f"✅ Success!")
+                print(f"   Distance: {result['distance_km']:.2f} km")
+                print(f"   Travel time: {result['duration_minutes']:.1f} minutes by public transport")
+            else:
+                print(f"❌ Failed with status: {result['status']}")
         else:
-            print(f"❌ Failed with status: {result['status']}")
-    else:
-        print("❌ No properties with valid coordinates found to test with!")
+            print("❌ No properties with valid coordinates found to test with!")
     
     # ================================================
     # CALCULATE DISTANCE FOR INCOMPLETE PROPERTIES
@@ -1364,17 +2545,50 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     needs_distance = []
     skipped_existing = 0
     skipped_too_far = 0
-    for idx in incomplete_indices:
-        # Check if distance data is missing (independent of completion status)
-        link = df_valid.at[idx, 'link']
-        finnkode = extract_finnkode(link) if link else None
+    skipped_too_far_hav = 0
+    hav_skipped_indices = set()  # Reported separately in the excluded list below
+    
+    # Classify all incomplete rows with column-wise masks up front; the loop below
+    # only reads the precomputed flags (and writes the per-property log lines)
+    incomplete_rows = df_valid.loc[incomplete_indices]
+    incomplete_finnkodes = extract_finnkodes(incomplete_rows['link'])
+    previously_too_far = incomplete_finnkodes.isin(too_far_finnkodes).to_numpy()
+    missing_distance = incomplete_rows[['distance_to_work_km', 'transit_time_work_minutes']].isna().any(axis=1).to_numpy()
+    
+    # Straight-line pre-filter: even at max_expected_transit_kmh, a property further away
+    # than this can't be reached within max_travel_time, so don't spend an API call on it
+    max_expected_transit_kmh = CONFIG.get('max_expected_transit_kmh')
+    if max_expected_transit_kmh and len(incomplete_indices) > 0:
+        max_straight_line_km = max_travel_time / 60 * max_expected_transit_kmh
+        hav_km = haversine_km_vec(
+            incomplete_rows['latitude'].to_numpy(dtype=float),
+            incomplete_rows['longitude'].to_numpy(dtype=float),
+            work_lat, work_lng
+        )
+        hav_too_far = hav_km > max_straight_line_km
+    else:
+        hav_too_far = np.zeros(len(incomplete_indices), dtype=bool)
+    
+    for idx, finnkode, is_too_far, is_missing, is_hav_too_far in zip(
+        incomplete_indices, incomplete_finnkodes, previously_too_far, missing_distance, hav_too_far
+    ):
+        if pd.isna(finnkode):
+            finnkode = None
         
         # Check if property was previously too far away (skip distance matrix API call if so)
-        if finnkode and finnkode in too_far_finnkodes:
+        if is_too_far:
             skipped_too_far += 1
             if finnkode:
                 logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: ✅ SKIPPED (previously too far away, no API calls)")
-        elif pd.isna(df_valid.at[idx, 'distance_to_work_km']) or pd.isna(df_valid.at[idx, 'transit_time_work_minutes']):
+        elif is_missing:
+            # Distance data is missing (independent of completion status)
+            if is_hav_too_far:
+                # Too far in a straight line - distance stays empty so it is re-checked next run
+                skipped_too_far_hav += 1
+                hav_skipped_indices.add(idx)
+                if finnkode:
+                    logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: ✅ SKIPPED_TOO_FAR_HAV (beyond {max_straight_line_km:.0f} km straight-line, no API calls)")
+                continue
             # This property needs distance calculation - will make API calls
             needs_distance.append(idx)
             if finnkode:
@@ -1388,11 +2602,14 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # Track skipped properties in tracker
     tracker.stats['step5_distance_calculation']['properties_skipped_existing'] = skipped_existing
     tracker.stats['step5_distance_calculation']['properties_skipped_too_far'] = skipped_too_far
+    tracker.stats['step5_distance_calculation']['properties_skipped_too_far_haversine'] = skipped_too_far_hav
     
     if skipped_existing > 0:
         print(f"✅ Skipped {skipped_existing} properties (already have distance data, no API calls)")
     if skipped_too_far > 0:
         print(f"✅ Skipped {skipped_too_far} properties (previously too far away, no API calls)")
+    if skipped_too_far_hav > 0:
+        print(f"✅ Skipped {skipped_too_far_hav} properties (more than {max_straight_line_km:.0f} km from work in a straight line, no API calls)")
     print()
     
     if not needs_distance:
@@ -1409,73 +2626,160 @@ def calculate_distances_and_filter(args, input_csv_path=None):
         print("(This may take a few minutes due to API rate limits)")
         print()
         
-        distance_start_time = time.time()
+        distance_start_time = time.perf_counter()
         distance_total = len(needs_distance)
         successful_count = 0
         failed_count = 0
         
-        for i, index in enumerate(needs_distance, 1):
-            # Check API safety limits before making distance matrix call
-            if distance_matrix_calls >= max_distance_matrix_calls:
-                if api_safety['hard_stop_on_limit']:
-                    logger.error(f"[{property_type.upper()}] [DISTANCE] API LIMIT REACHED: {distance_matrix_calls}/{max_distance_matrix_calls} distance matrix calls. STOPPING.")
-                    print(f"\n⚠️  API LIMIT REACHED: {distance_matrix_calls}/{max_distance_matrix_calls} distance matrix calls")
-                    print("   Stopping to prevent API credit exhaustion.")
-                    break
-                else:
-                    logger.warning(f"[{property_type.upper()}] [DISTANCE] API LIMIT REACHED but hard_stop_on_limit is False. Continuing...")
-            
-            # Check warning threshold
-            if distance_matrix_calls >= warning_threshold_dm and distance_matrix_calls < max_distance_matrix_calls:
-                logger.warning(f"[{property_type.upper()}] [DISTANCE] Approaching API limit: {distance_matrix_calls}/{max_distance_matrix_calls} calls ({int(distance_matrix_calls*100/max_distance_matrix_calls)}%)")
-            
-            row = df_valid.loc[index]
-            property_address = row['address']
-            property_lat = row['latitude']
-            property_lng = row['longitude']
-            link = row.get('link')
-            finnkode = extract_finnkode(link) if link else None
-            
-            # Calculate remaining time estimate
-            if i > 1:
-                elapsed = time.time() - distance_start_time
-                avg_per_property = elapsed / (i - 1)
-                remaining = avg_per_property * (distance_total - i + 1)
-                remaining_str = f" (~{remaining/60:.1f} min remaining)" if remaining > 60 else f" (~{remaining:.0f}s remaining)"
+        # Snap origins to a ~11 m grid (4 decimals): properties in the same building share
+        # one origin, and its result is copied to every property in that cell
+        needs_distance_rows = df_valid.loc[needs_distance]
+        origin_cells = zip(
+            needs_distance_rows['latitude'].round(ORIGIN_SNAP_DECIMALS),
+            needs_distance_rows['longitude'].round(ORIGIN_SNAP_DECIMALS)
+        )
+        cell_to_indices = {}
+        for index, cell in zip(needs_distance, origin_cells):
+            cell_to_indices.setdefault(cell, []).append(index)
+        if len(cell_to_indices) < distance_total:
+            print(f"📍 {distance_total} properties share {len(cell_to_indices)} distinct origins (same building/location)")
+        
+        # Per-property values the loops below read, pulled out of df_valid once; results are
+        # collected in distance_results and written back with one assignment per column
+        lat_by_index = dict(zip(needs_distance, needs_distance_rows['latitude'].tolist()))
+        lng_by_index = dict(zip(needs_distance, needs_distance_rows['longitude'].tolist()))
+        address_by_index = dict(zip(needs_distance, needs_distance_rows['address'].tolist()))
+        distance_results = {}
+        
+        processed = 0
+        
+        # Origins answered by an earlier run (same ~11 m cell, same work location) are
+        # applied from the on-disk cache without an API call
+        cell_keys = {
+            cell: get_work_distance_cache_key(cell, work_lat, work_lng, 'transit')
+            for cell in cell_to_indices
+        }
+        cached_distances = load_cached_work_distances(cell_keys.values())
+        if cached_distances:
+            print(f"💾 {len(cached_distances)} origins answered from the distance cache (no API calls)")
+        for cell, members in list(cell_to_indices.items()):
+            cached = cached_distances.get(cell_keys[cell])
+            if cached is None:
+                continue
+            del cell_to_indices[cell]
+            distance_km, duration_minutes = cached
+            for index in members:
+                processed += 1
+                successful_count += 1
+                finnkode = finnkode_by_idx.get(index)
+                distance_results[index] = cached
+                print(f"[{processed}/{distance_total}] {address_by_index[index]}")
+                if finnkode:
+                    logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: CACHED - Distance: {distance_km:.2f} km, Time: {duration_minutes:.1f} min (no API call)")
+                print(f"  ✅ Distance: {distance_km:.2f} km, Time: {duration_minutes:.1f} min (cached)")
+        
+        # Batch up to DISTANCE_MATRIX_MAX_ORIGINS distinct origins per Distance Matrix request
+        cell_items = list(cell_to_indices.items())
+        chunks = [
+            cell_items[chunk_start:chunk_start + DISTANCE_MATRIX_MAX_ORIGINS]
+            for chunk_start in range(0, len(cell_items), DISTANCE_MATRIX_MAX_ORIGINS)
+        ]
+        
+        # Check API safety limits before making distance matrix calls (one call per chunk)
+        remaining_dm_calls = max(max_distance_matrix_calls - distance_matrix_calls, 0)
+        if len(chunks) > remaining_dm_calls:
+            if api_safety['hard_stop_on_limit']:
+                logger.error(f"[{property_type.upper()}] [DISTANCE] API LIMIT REACHED: {distance_matrix_calls + remaining_dm_calls}/{max_distance_matrix_calls} distance matrix calls. STOPPING.")
+                print(f"\n⚠️  API LIMIT REACHED: {distance_matrix_calls + remaining_dm_calls}/{max_distance_matrix_calls} distance matrix calls")
+                print("   Stopping to prevent API credit exhaustion.")
+                chunks = chunks[:remaining_dm_calls]
             else:
-                remaining_str = ""
-            
-            print(f"[{i}/{distance_total}] Processing: {property_address}{remaining_str}")
-            if finnkode:
-                logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: Making distance matrix API call")
+                logger.warning(f"[{property_type.upper()}] [DISTANCE] API LIMIT REACHED but hard_stop_on_limit is False. Continuing...")
+        
+        # Check warning threshold
+        if distance_matrix_calls + len(chunks) >= warning_threshold_dm and distance_matrix_calls < max_distance_matrix_calls:
+            logger.warning(f"[{property_type.upper()}] [DISTANCE] Approaching API limit: {distance_matrix_calls + len(chunks)}/{max_distance_matrix_calls} calls ({int((distance_matrix_calls + len(chunks))*100/max_distance_matrix_calls)}%)")
+        
+        # Chunks are independent network-bound requests - run them on a thread pool.
+        # check_rate_limit() is thread-safe, so the limiter still caps total throughput.
+        api_workers = max(1, min(CONFIG.get('api_workers', 10), len(chunks) or 1))
+        
+        with ThreadPoolExecutor(max_workers=api_workers) as executor:
+            futures = {}
+            for chunk_items in chunks:
+                # The first property in each cell is the representative origin
+                chunk_coords = [
+                    (lat_by_index[members[0]], lng_by_index[members[0]])
+                    for _, members in chunk_items
+                ]
+                
+                for _, members in chunk_items:
+                    for index in members:
+                        finnkode = finnkode_by_idx.get(index)
+                        if finnkode:
+                            logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: Making distance matrix API call")
+                
+                future = executor.submit(
+                    calculate_distances_batch,
+                    chunk_coords, work_lat, work_lng,
+                    mode='transit', gmaps_client=gmaps_client
+                )
+                futures[future] = chunk_items
+                distance_matrix_calls += 1  # Track API call (one request per chunk)
             
-            if i % 10 == 0:
+            # Results are applied on this thread as each chunk completes
+            for future in as_completed(futures):
+                chunk_items = futures[future]
+                chunk_cells = [members for _, members in chunk_items]
+                try:
+                    chunk_results = future.result()
+                except Exception as e:
+                    logger.error(f"[{property_type.upper()}] [DISTANCE] Batch of {len(chunk_cells)} origins failed: {str(e)}")
+                    chunk_results = [{'distance_km': None, 'duration_minutes': None, 'status': 'ERROR'}] * len(chunk_cells)
+                
+                store_cached_work_distances([
+                    (cell_keys[cell], result['distance_km'], result['duration_minutes'])
+                    for (cell, _), result in zip(chunk_items, chunk_results)
+                    if result['status'] == 'OK'
+                ])
+                
+                for index, result in (
+                    (index, result)
+                    for members, result in zip(chunk_cells, chunk_results)
+                    for index in members
+                ):
+                    processed += 1
+                    finnkode = finnkode_by_idx.get(index)
+                    distance_results[index] = (result['distance_km'], result['duration_minutes'])
+                    
+                    print(f"[{processed}/{distance_total}] {address_by_index[index]}")
+                    if result['status'] == 'OK':
+                        successful_count += 1
+                        if finnkode:
+                            logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: SUCCESS - Distance: {result['distance_km']:.2f} km, Time: {result['duration_minutes']:.1f} min")
+                        print(f"  ✅ Distance: {result['distance_km']:.2f} km, Time: {result['duration_minutes']:.1f} min")
+                    else:
+                        failed_count += 1
+                        if finnkode:
+                            logger.warning(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: FAILED - Status: {result['status']}")
+                        print(f"  ❌ Status: {result['status']}")
+                
+                # Calculate remaining time estimate
+                elapsed = time.perf_counter() - distance_start_time
+                remaining = elapsed / processed * (distance_total - processed) if processed else 0
+                remaining_str = f"~{remaining/60:.1f} min remaining" if remaining > 60 else f"~{remaining:.0f}s remaining"
                 stats = get_api_stats()
-                logger.info(f"Progress: {i}/{distance_total} properties processed")
+                logger.info(f"Progress: {processed}/{distance_total} properties processed ({remaining_str})")
                 logger.info(f"API stats - Total calls: {stats['total_calls']}, "
                            f"Distance Matrix in window: {stats['distance_matrix_calls_in_window']}, "
                            f"Places in window: {stats['places_calls_in_window']}")
-            
-            result = calculate_distance_to_work(
-                property_lat, property_lng, work_lat, work_lng,
-                mode='transit', gmaps_client=gmaps_client
-            )
-            distance_matrix_calls += 1  # Track API call
-            
-            # Update the DataFrame in place
-            df_valid.at[index, 'distance_to_work_km'] = result['distance_km']
-            df_valid.at[index, 'transit_time_work_minutes'] = result['duration_minutes']
-            
-            if result['status'] == 'OK':
-                successful_count += 1
-                if finnkode:
-                    logger.info(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: SUCCESS - Distance: {result['distance_km']:.2f} km, Time: {result['duration_minutes']:.1f} min")
-                print(f"  ✅ Distance: {result['distance_km']:.2f} km, Time: {result['duration_minutes']:.1f} min")
-            else:
-                failed_count += 1
-                if finnkode:
-                    logger.warning(f"[{property_type.upper()}] [DISTANCE] Property {finnkode}: FAILED - Status: {result['status']}")
-                print(f"  ❌ Status: {result['status']}")
+        
+        # Write all results back to the DataFrame at once (failed lookups are stored as empty)
+        if distance_results:
+            updated_indices = list(distance_results)
+            updated_values = np.array([distance_results[index] for index in updated_indices], dtype=float)  # None -> NaN
+            df_valid.loc[updated_indices, 'distance_to_work_km'] = updated_values[:, 0]
+            df_valid.loc[updated_indices, 'transit_time_work_minutes'] = updated_values[:, 1]
         
         print()
         print("="*70)
@@ -1502,87 +2806,70 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     
     # Filter properties: only include those with valid transit_time within limit
     # This ensures properties outside the range are NEVER included in places API calls
-    df_filtered = df_valid[
-        (df_valid['transit_time_work_minutes'].notna()) & 
-        (df_valid['transit_time_work_minutes'] <= max_travel_time)
-    ].copy()
+    # (one NumPy mask, reused below for the re-qualification check and the excluded listing)
+    transit_times = df_valid['transit_time_work_minutes'].to_numpy(dtype=float, na_value=np.nan)
+    passes_filter = ~np.isnan(transit_times) & (transit_times <= max_travel_time)
+    df_filtered = df_valid[passes_filter].copy()
     
     # Re-apply existing place data to df_filtered to ensure all existing place data is available
-    for idx in df_filtered.index:
-        link = df_filtered.at[idx, 'link']
-        finnkode = extract_finnkode(link) if link else None
-        if finnkode and finnkode in existing_data:
-            existing_row = existing_data[finnkode]
-            for col, val in existing_row.items():
-                if col not in df_filtered.columns:
-                    df_filtered[col] = None
-                    df_filtered.at[idx, col] = val
-                elif pd.isna(df_filtered.at[idx, col]) and not pd.isna(val):
-                    df_filtered.at[idx, col] = val
+    # (one aligned lookup frame, then one masked gap-fill per column)
+    if existing_data and len(df_filtered) > 0:
+        filtered_finnkodes = pd.Series(
+            [finnkode_by_idx.get(idx) for idx in df_filtered.index],
+            index=df_filtered.index, dtype=object
+        )
+        matched = filtered_finnkodes.isin(existing_lookup.index).to_numpy()
+        if matched.any():
+            matched_index = df_filtered.index[matched]
+            existing_rows = existing_lookup.loc[filtered_finnkodes[matched].tolist()]
+            existing_rows.index = matched_index
+            # Columns only the existing data has are added (all None) in one concat up front
+            missing_columns = existing_lookup.columns.difference(df_filtered.columns, sort=False)
+            if len(missing_columns) > 0:
+                df_filtered = pd.concat(
+                    [df_filtered, pd.DataFrame(None, index=df_filtered.index, columns=missing_columns, dtype=object)],
+                    axis=1
+                )
+            for col in existing_lookup.columns:
+                existing_values = existing_rows[col]
+                has_value = (existing_values.notna() & df_filtered.loc[matched_index, col].isna()).to_numpy()
+                fill_index = matched_index[has_value]
+                if len(fill_index) > 0:
+                    df_filtered.loc[fill_index, col] = existing_values[fill_index]
     
     # ================================================
     # INCLUDE PROPERTIES THAT NOW QUALIFY DUE TO INCREASED MAX_TRANSIT_TIME
     # ================================================
     # If max_transit_time increased, properties that were previously filtered out
     # but now pass the threshold should get places API calls
-    properties_added_due_to_increase = 0
-    df_filtered_indices = set(df_filtered.index)
-    
-    for idx, row in df_valid.iterrows():
-        if idx in df_filtered_indices:
-            continue  # Already in df_filtered
-        
-        # Check if property passes current max_transit_time filter
-        transit_time = row.get('transit_time_work_minutes')
-        if pd.isna(transit_time) or transit_time > max_travel_time:
-            continue  # Doesn't pass current filter
-        
-        # Check work location match
-        stored_work_lat = row.get('work_lat')
-        stored_work_lng = row.get('work_lng')
-        if not work_location_matches(stored_work_lat, stored_work_lng, work_lat, work_lng):
-            continue  # Work location changed, skip
-        
-        # Check if property should be included (either has no places data, or was processed with lower max_transit_time)
-        stored_max_transit_time = row.get('max_transit_time_work_minutes')
-        
-        # Determine if property needs places API calls
-        needs_places_api = False
-        if pd.isna(stored_max_transit_time):
-            # No stored max_transit_time - check if has places data
-            has_places_data = False
-            for cat_name, cat_config in place_categories.items():
-                prefix = cat_config['column_prefix']
-                walking_col = f'walking_time_{prefix}_minutes'
-                if pd.notna(row.get(walking_col)):
-                    has_places_data = True
-                    break
-            if not has_places_data:
-                needs_places_api = True
-        else:
-            # Has stored max_transit_time - check if it's less than current (was filtered out before)
-            if stored_max_transit_time < max_travel_time:
-                # Was processed with lower threshold, now qualifies - needs places API
-                needs_places_api = True
-        
-        if needs_places_api:
-            # Double-check: ensure property passes current max_transit_time filter
-            # This is a safety check to prevent properties outside range from being added
-            if pd.isna(transit_time) or transit_time > max_travel_time:
-                continue  # Safety check failed - skip this property
-            
-            # Add property to df_filtered
-            new_row = row.copy()
-            # Ensure all columns from df_filtered exist in new_row
-            for col in df_filtered.columns:
-                if col not in new_row.index:
-                    new_row[col] = None
-            # Ensure transit_time_work_minutes is set correctly
-            if 'transit_time_work_minutes' not in new_row.index or pd.isna(new_row.get('transit_time_work_minutes')):
-                new_row['transit_time_work_minutes'] = transit_time
-            # Add to df_filtered (append as new row)
-            df_filtered = pd.concat([df_filtered, new_row.to_frame().T], ignore_index=False)
-            properties_added_due_to_increase += 1
+    # One boolean mask over whole columns: the property passes the current filter, was
+    # measured against this work location, and either has no places data yet or was last
+    # processed with a lower max_transit_time (a missing column counts as "no value")
+    if 'work_lat' in df_valid.columns and 'work_lng' in df_valid.columns:
+        same_work_location = work_location_matches_vec(df_valid['work_lat'], df_valid['work_lng'], work_lat, work_lng)
+    else:
+        same_work_location = np.zeros(len(df_valid), dtype=bool)
+    
+    present_walking_cols = [col for col in walking_cols if col in df_valid.columns]
+    if present_walking_cols:
+        has_places_data = df_valid[present_walking_cols].notna().any(axis=1).to_numpy()
+    else:
+        has_places_data = np.zeros(len(df_valid), dtype=bool)
+    
+    if 'max_transit_time_work_minutes' in df_valid.columns:
+        stored_max_transit_times = pd.to_numeric(df_valid['max_transit_time_work_minutes'], errors='coerce').to_numpy(dtype=float)
+    else:
+        stored_max_transit_times = np.full(len(df_valid), np.nan)
+    # NaN < x is False, so only a stored, lower threshold counts as "was filtered out before"
+    needs_places_api = (np.isnan(stored_max_transit_times) & ~has_places_data) | (stored_max_transit_times < max_travel_time)
+    
+    newly_qualifying = (
+        ~df_valid.index.isin(df_filtered.index) & passes_filter & same_work_location & needs_places_api
+    )
+    properties_added_due_to_increase = int(newly_qualifying.sum())
+    if properties_added_due_to_increase > 0:
+        # Added in one concat; columns only df_filtered has are left empty for these rows
+        df_filtered = pd.concat([df_filtered, df_valid[newly_qualifying]])
     
     if properties_added_due_to_increase > 0:
         print(f"✅ Added {properties_added_due_to_increase} properties that now qualify due to increased max_transit_time (will get places API calls)")
@@ -1596,27 +2883,35 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     if len(df_filtered) > 0:
         print("✅ Properties within travel time limit:")
         print("-" * 70)
-        for idx, row in df_filtered.iterrows():
-            print(f"  • {row['address']}")
-            print(f"    Distance: {row['distance_to_work_km']:.2f} km, Time: {row['transit_time_work_minutes']:.1f} min")
+        # Built as one string and written once instead of two print calls per property
+        print("\n".join(
+            f"  • {address}\n    Distance: {distance_km:.2f} km, Time: {transit_minutes:.1f} min"
+            for address, distance_km, transit_minutes in zip(
+                df_filtered['address'], df_filtered['distance_to_work_km'], df_filtered['transit_time_work_minutes']
+            )
+        ))
         print()
     else:
         print("⚠️  No properties found within the travel time limit!")
         print()
     
     # Show excluded properties
-    df_excluded = df_valid[
-        ~((df_valid['transit_time_work_minutes'].notna()) & (df_valid['transit_time_work_minutes'] <= max_travel_time))
-    ].copy()
+    df_excluded = df_valid[~passes_filter].copy()
     
     if len(df_excluded) > 0:
         print("❌ Properties excluded:")
         print("-" * 70)
-        for idx, row in df_excluded.iterrows():
-            if pd.notna(row['transit_time_work_minutes']):
-                print(f"  • {row['address']} - Travel time: {row['transit_time_work_minutes']:.1f} min (exceeds limit)")
+        excluded_lines = []
+        for idx, address, transit_minutes in zip(
+            df_excluded.index, df_excluded['address'], df_excluded['transit_time_work_minutes']
+        ):
+            if pd.notna(transit_minutes):
+                excluded_lines.append(f"  • {address} - Travel time: {transit_minutes:.1f} min (exceeds limit)")
+            elif idx in hav_skipped_indices:
+                excluded_lines.append(f"  • {address} - Too far in a straight line (beyond {max_straight_line_km:.0f} km, not queried)")
             else:
-                print(f"  • {row['address']} - Travel time calculation failed")
+                excluded_lines.append(f"  • {address} - Travel time calculation failed")
+        print("\n".join(excluded_lines))
         print()
     
     # ================================================
@@ -1627,8 +2922,6 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     print("SAVING INTERMEDIATE RESULTS")
     print("="*70)
     
-    os.makedirs(output_dir, exist_ok=True)
-    
     # Store work location in DataFrame before saving
     # Ensure these columns exist for both rental and sales properties
     if 'work_lat' not in df_valid.columns:
@@ -1648,14 +2941,15 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     
     # Use type-aware filenames
     output_filename_all = get_type_aware_filename('property_listings_with_distances', property_type, file_suffix)
-    output_file_all = os.path.join(output_dir, output_filename_all)
-    df_valid.to_csv(output_file_all, index=False, encoding='utf-8')
+    output_file_all = output_path / output_filename_all
+    write_csv(df_valid, output_file_all)
+    write_columnar_copy(df_valid, output_file_all)
     print(f"💾 Saved all properties with distances to: {output_file_all}")
     
     if len(df_filtered) > 0:
         output_filename_filtered = get_type_aware_filename('property_listings_filtered_by_distance', property_type, file_suffix)
-        output_file_filtered = os.path.join(output_dir, output_filename_filtered)
-        df_filtered.to_csv(output_file_filtered, index=False, encoding='utf-8')
+        output_file_filtered = output_path / output_filename_filtered
+        write_csv(df_filtered, output_file_filtered)
         print(f"💾 Saved filtered properties to: {output_file_filtered}")
     else:
         print("⚠️  No filtered properties to save (all exceeded distance limit)")
@@ -1668,61 +2962,29 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     
     if len(df_filtered) > 0:
         # Initialize place columns if they don't exist
-        for cat_name, cat_config in place_categories.items():
-            prefix = cat_config['column_prefix']
-            if f'nearest_{prefix}' not in df_filtered.columns:
-                df_filtered[f'nearest_{prefix}'] = None
-            if f'walking_time_{prefix}_minutes' not in df_filtered.columns:
-                df_filtered[f'walking_time_{prefix}_minutes'] = None
-            if cat_config.get('calculate_transit', False):
-                if f'transit_time_{prefix}_minutes' not in df_filtered.columns:
-                    df_filtered[f'transit_time_{prefix}_minutes'] = None
+        for prefix, nearest_col, walking_col, transit_col, calc_transit in cat_meta.values():
+            if nearest_col not in df_filtered.columns:
+                df_filtered[nearest_col] = None
+            if walking_col not in df_filtered.columns:
+                df_filtered[walking_col] = None
+            if calc_transit:
+                if transit_col not in df_filtered.columns:
+                    df_filtered[transit_col] = None
         
         # Find properties that need place data for any category
-        needs_place_data = []
-        all_have_place_data = []
-        for idx, row in df_filtered.iterrows():
-            needs_any = False
-            for cat_name, cat_config in place_categories.items():
-                prefix = cat_config['column_prefix']
-                walking_col = f'walking_time_{prefix}_minutes'
-                
-                # If any category is missing walking time, we need to process this property
-                if pd.isna(row.get(walking_col)):
-                    needs_any = True
-                    break
-            if needs_any:
-                needs_place_data.append(idx)
-            else:
-                all_have_place_data.append(idx)
-        
-        # Filter out properties that exceed max_transit_time (safety check - should already be filtered, but ensure no API calls for excluded properties)
-        # This is critical for sales properties to avoid unnecessary API calls
-        original_count = len(needs_place_data)
-        needs_place_data = [
-            idx for idx in needs_place_data 
-            if pd.notna(df_filtered.at[idx, 'transit_time_work_minutes']) 
-            and df_filtered.at[idx, 'transit_time_work_minutes'] <= max_travel_time
-        ]
-        excluded_count = original_count - len(needs_place_data)
-        
-        # Additional safety: Remove any properties from df_filtered that exceed max_travel_time
-        # This ensures df_filtered only contains properties within the limit
-        if excluded_count > 0:
-            # Find indices in df_filtered that exceed max_travel_time
-            exceed_mask = (
-                df_filtered['transit_time_work_minutes'].notna() & 
-                (df_filtered['transit_time_work_minutes'] > max_travel_time)
-            )
-            if exceed_mask.any():
-                exceeded_indices = df_filtered[exceed_mask].index.tolist()
-                df_filtered = df_filtered[~exceed_mask].copy()
-                print(f"⚠️  Removed {len(exceeded_indices)} properties from df_filtered that exceeded max_travel_time (safety check)")
+        # If any category is missing walking time, we need to process this property
+        missing_place_mask = df_filtered[walking_cols].isna().any(axis=1).values
+        needs_place_data = df_filtered.index[missing_place_mask].tolist()
+        all_have_place_data = df_filtered.index[~missing_place_mask].tolist()
+        
+        # df_filtered only ever takes rows from passes_filter (the travel-time filter and the
+        # re-qualification step above), so no property here can exceed max_travel_time and
+        # none of them makes places API calls it shouldn't. Checked once; stripped under python -O
+        assert (df_filtered['transit_time_work_minutes'] <= max_travel_time).all(), \
+            "df_filtered contains properties outside max_travel_time"
         
         if len(all_have_place_data) > 0:
             print(f"✅ Skipped {len(all_have_place_data)} properties (already have all place data, no API calls)")
-        if excluded_count > 0:
-            print(f"✅ Excluded {excluded_count} properties (exceed max_transit_time, no API calls)")
         print()
         
         if not needs_place_data:
@@ -1743,53 +3005,65 @@ def calculate_distances_and_filter(args, input_csv_path=None):
             
             processed_count = 0
             total_properties = len(needs_place_data)
-            place_start_time = time.time()
+            place_start_time = time.perf_counter()
             category_found_counts = {cat_name: 0 for cat_name in place_categories.keys()}
+            places_calls_lock = threading.Lock()
             
-            for idx in needs_place_data:
-                row = df_filtered.loc[idx]
-                processed_count += 1
-                property_address = row['address']
+            def find_places_for_property(idx, row):
+                """
+                Find the nearest place and its travel times for every category one property is missing.
+                
+                Runs on a worker thread, so it only reads the row snapshot it is given and
+                hands its column updates and console lines back to the caller, which applies
+                and prints them on the main thread. The places call budget is shared between
+                workers and reserved under places_calls_lock before each search.
+                
+                Args:
+                    idx: df_filtered index of the property
+                    row: Dict snapshot of the property's row
+                
+                Returns:
+                    tuple: (updates, lines, found_categories) - column -> value updates for this
+                        property, its console lines, and the categories that now have data
+                """
+                nonlocal places_calls
+                
+                updates = {}
+                lines = []
+                found_categories = []
                 property_lat = row['latitude']
                 property_lng = row['longitude']
+                finnkode = finnkode_by_idx.get(idx)
                 
-                if processed_count > 1:
-                    elapsed = time.time() - place_start_time
-                    avg_per_property = elapsed / (processed_count - 1)
-                    remaining = avg_per_property * (total_properties - processed_count + 1)
-                    remaining_str = f" (~{remaining/60:.1f} min remaining)" if remaining > 60 else f" (~{remaining:.0f}s remaining)"
-                else:
-                    remaining_str = ""
-                
-                print(f"[{processed_count}/{total_properties}] Processing: {property_address}{remaining_str}")
+                # Nearest places that still need travel times - resolved together in one fused lookup
+                pending_travel_times = []
                 
                 for cat_name, cat_config in place_categories.items():
-                    prefix = cat_config['column_prefix']
-                    walking_col = f'walking_time_{prefix}_minutes'
+                    prefix, nearest_col, walking_col, transit_col, calc_transit = cat_meta[cat_name]
                     
                     # Skip if this category already has data
-                    if not pd.isna(df_filtered.at[idx, walking_col]):
-                        existing_name = df_filtered.at[idx, f'nearest_{prefix}']
-                        print(f"  ⏭️  {cat_name}: Already have data ({existing_name})")
-                        category_found_counts[cat_name] += 1
+                    if not pd.isna(row[walking_col]):
+                        lines.append(f"  ⏭️  {cat_name}: Already have data ({row[nearest_col]})")
+                        found_categories.append(cat_name)
                         continue
                     
-                    # Check API safety limits before making places API call
-                    if places_calls >= max_places_calls:
-                        if api_safety['hard_stop_on_limit']:
-                            logger.error(f"[{property_type.upper()}] [PLACES] API LIMIT REACHED: {places_calls}/{max_places_calls} places calls. STOPPING.")
-                            print(f"\n⚠️  API LIMIT REACHED: {places_calls}/{max_places_calls} places calls")
-                            print("   Stopping to prevent API credit exhaustion.")
-                            break
-                        else:
-                            logger.warning(f"[{property_type.upper()}] [PLACES] API LIMIT REACHED but hard_stop_on_limit is False. Continuing...")
-                    
-                    # Check warning threshold
-                    if places_calls >= warning_threshold_places and places_calls < max_places_calls:
-                        logger.warning(f"[{property_type.upper()}] [PLACES] Approaching API limit: {places_calls}/{max_places_calls} calls ({int(places_calls*100/max_places_calls)}%)")
+                    # Check API safety limits and reserve a places call before making it
+                    with places_calls_lock:
+                        if places_calls >= max_places_calls:
+                            if api_safety['hard_stop_on_limit']:
+                                logger.error(f"[{property_type.upper()}] [PLACES] API LIMIT REACHED: {places_calls}/{max_places_calls} places calls. STOPPING.")
+                                lines.append(f"\n⚠️  API LIMIT REACHED: {places_calls}/{max_places_calls} places calls")
+                                lines.append("   Stopping to prevent API credit exhaustion.")
+                                break
+                            else:
+                                logger.warning(f"[{property_type.upper()}] [PLACES] API LIMIT REACHED but hard_stop_on_limit is False. Continuing...")
+                        
+                        # Check warning threshold
+                        if places_calls >= warning_threshold_places and places_calls < max_places_calls:
+                            logger.warning(f"[{property_type.upper()}] [PLACES] Approaching API limit: {places_calls}/{max_places_calls} calls ({int(places_calls*100/max_places_calls)}%)")
+                        
+                        places_calls += 1  # Track API call (approximate - find_nearby_places makes multiple calls)
                     
-                    link = row.get('link')
-                    finnkode = extract_finnkode(link) if link else None
                     if finnkode:
                         logger.info(f"[{property_type.upper()}] [PLACES] Property {finnkode}: Making places API call for category '{cat_name}'")
                     
@@ -1800,87 +3074,133 @@ def calculate_distances_and_filter(args, input_csv_path=None):
                             radius_meters=search_radius,
                             gmaps_client=gmaps_client
                         )
-                        places_calls += 1  # Track API call (approximate - find_nearby_places makes multiple calls)
                         
                         if nearest and nearest.get('status') == 'OK':
-                            df_filtered.at[idx, f'nearest_{prefix}'] = nearest['name']
+                            updates[nearest_col] = nearest['name']
                             
                             # Check if we already have the required travel times
                             modes_needed = []
-                            if pd.isna(df_filtered.at[idx, f'walking_time_{prefix}_minutes']):
+                            if pd.isna(row[walking_col]):
                                 modes_needed.append('walking')
-                            if cat_config.get('calculate_transit', False) and pd.isna(df_filtered.at[idx, f'transit_time_{prefix}_minutes']):
+                            if calc_transit and pd.isna(row[transit_col]):
                                 modes_needed.append('transit')
                             
                             if not modes_needed:
                                 # Already have all required travel times, skip API call
                                 if finnkode:
                                     logger.info(f"[{property_type.upper()}] [PLACES] Property {finnkode}: SKIPPED transit time calculation (already have data)")
-                                category_found_counts[cat_name] += 1
-                                walk_str = f"{df_filtered.at[idx, f'walking_time_{prefix}_minutes']:.1f} min walk" if pd.notna(df_filtered.at[idx, f'walking_time_{prefix}_minutes']) else "N/A"
+                                found_categories.append(cat_name)
+                                walk_str = f"{row[walking_col]:.1f} min walk" if pd.notna(row[walking_col]) else "N/A"
                                 transit_str = ""
-                                if cat_config.get('calculate_transit', False) and pd.notna(df_filtered.at[idx, f'transit_time_{prefix}_minutes']):
-                                    transit_str = f", {df_filtered.at[idx, f'transit_time_{prefix}_minutes']:.1f} min transit"
-                                print(f"  ✅ {cat_name}: {nearest['name']} ({nearest['distance_km']:.2f} km) - {walk_str}{transit_str} (using existing data)")
+                                if calc_transit and pd.notna(row[transit_col]):
+                                    transit_str = f", {row[transit_col]:.1f} min transit"
+                                lines.append(f"  ✅ {cat_name}: {nearest['name']} ({nearest['distance_km']:.2f} km) - {walk_str}{transit_str} (using existing data)")
                             else:
-                                travel_times = calculate_travel_time_to_place(
-                                    property_lat, property_lng,
-                                    nearest['lat'], nearest['lng'],
-                                    modes=modes_needed,  # Only request modes we need
-                                    gmaps_client=gmaps_client
-                                )
-                                
-                                # Update only the modes we calculated
-                                if 'walking' in modes_needed:
-                                    df_filtered.at[idx, f'walking_time_{prefix}_minutes'] = travel_times.get('walking_minutes')
-                                
-                                if 'transit' in modes_needed and cat_config.get('calculate_transit', False):
-                                    df_filtered.at[idx, f'transit_time_{prefix}_minutes'] = travel_times.get('transit_minutes')
-                                elif cat_config.get('calculate_transit', False):
-                                    # Preserve existing transit time if we didn't request it
-                                    pass
-                                
-                                category_found_counts[cat_name] += 1
-                                
-                                walk_str = f"{travel_times.get('walking_minutes') or df_filtered.at[idx, f'walking_time_{prefix}_minutes']:.1f} min walk" if (travel_times.get('walking_minutes') or pd.notna(df_filtered.at[idx, f'walking_time_{prefix}_minutes'])) else "N/A"
-                                transit_str = ""
-                                if cat_config.get('calculate_transit', False):
-                                    transit_val = travel_times.get('transit_minutes') or df_filtered.at[idx, f'transit_time_{prefix}_minutes']
-                                    if transit_val:
-                                        transit_str = f", {transit_val:.1f} min transit"
-                                
-                                print(f"  ✅ {cat_name}: {nearest['name']} ({nearest['distance_km']:.2f} km) - {walk_str}{transit_str}")
+                                pending_travel_times.append((cat_name, cat_config, nearest, modes_needed))
                         else:
-                            print(f"  ⚠️  {cat_name}: No places found within {search_radius / 1000:.1f} km")
+                            lines.append(f"  ⚠️  {cat_name}: No places found within {search_radius / 1000:.1f} km")
                             
                     except Exception as e:
-                        print(f"  ❌ {cat_name}: Error - {str(e)}")
+                        lines.append(f"  ❌ {cat_name}: Error - {str(e)}")
+                
+                # Fused travel-time lookup: one Distance Matrix call per mode for all categories of this property
+                if pending_travel_times:
+                    try:
+                        all_travel_times = calculate_travel_times_to_places(
+                            property_lat, property_lng,
+                            [(nearest['lat'], nearest['lng'], modes_needed) for _, _, nearest, modes_needed in pending_travel_times],  # Only request modes we need
+                            gmaps_client=gmaps_client
+                        )
+                    except Exception as e:
+                        all_travel_times = None
+                        for cat_name, _, _, _ in pending_travel_times:
+                            lines.append(f"  ❌ {cat_name}: Error - {str(e)}")
+                    
+                    for (cat_name, cat_config, nearest, modes_needed), travel_times in zip(pending_travel_times, all_travel_times or []):
+                        prefix, nearest_col, walking_col, transit_col, calc_transit = cat_meta[cat_name]
+                        
+                        # Update only the modes we calculated; existing transit times are preserved
+                        if 'walking' in modes_needed:
+                            updates[walking_col] = travel_times.get('walking_minutes')
+                        if 'transit' in modes_needed and calc_transit:
+                            updates[transit_col] = travel_times.get('transit_minutes')
+                        
+                        found_categories.append(cat_name)
+                        
+                        walking_val = updates.get(walking_col, row[walking_col])
+                        walk_str = f"{travel_times.get('walking_minutes') or walking_val:.1f} min walk" if (travel_times.get('walking_minutes') or pd.notna(walking_val)) else "N/A"
+                        transit_str = ""
+                        if calc_transit:
+                            transit_val = travel_times.get('transit_minutes') or updates.get(transit_col, row[transit_col])
+                            if transit_val:
+                                transit_str = f", {transit_val:.1f} min transit"
+                        
+                        lines.append(f"  ✅ {cat_name}: {nearest['name']} ({nearest['distance_km']:.2f} km) - {walk_str}{transit_str}")
+                
+                return updates, lines, found_categories
+            
+            # Properties are independent, network-bound units - run them on their own pool.
+            # The searches inside each one are leaf calls on the shared API pool, and the
+            # rate limiter still caps total throughput.
+            place_workers = max(1, min(CONFIG.get('api_workers', 10), total_properties))
+            place_results = {}  # column -> {idx: value}, written back once at the end
+            
+            with ThreadPoolExecutor(max_workers=place_workers, thread_name_prefix='places') as executor:
+                futures = {
+                    executor.submit(find_places_for_property, idx, df_filtered.loc[idx].to_dict()): idx
+                    for idx in needs_place_data
+                }
                 
-                print()
+                # Results are printed and collected on this thread as each property completes
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    processed_count += 1
+                    updates, lines, found_categories = future.result()
+                    
+                    elapsed = time.perf_counter() - place_start_time
+                    remaining = elapsed / processed_count * (total_properties - processed_count)
+                    remaining_str = f" (~{remaining/60:.1f} min remaining)" if remaining > 60 else f" (~{remaining:.0f}s remaining)"
+                    
+                    # One write per property: header, category lines and the blank separator
+                    print("\n".join([
+                        f"[{processed_count}/{total_properties}] Processing: {df_filtered.at[idx, 'address']}{remaining_str}",
+                        *lines,
+                        ""
+                    ]))
+                    
+                    for cat_name in found_categories:
+                        category_found_counts[cat_name] += 1
+                    for col, val in updates.items():
+                        place_results.setdefault(col, {})[idx] = val
+            
+            # Write all place results back to df_filtered at once, one assignment per column
+            for col, values_by_idx in place_results.items():
+                df_filtered.loc[list(values_by_idx), col] = pd.Series(values_by_idx)
             
             print()
             print("="*70)
             print("PLACE SEARCH SUMMARY")
             print("="*70)
             
-            for cat_name in place_categories.keys():
-                prefix = place_categories[cat_name]['column_prefix']
-                found_count = df_filtered[f'walking_time_{prefix}_minutes'].notna().sum()
-                total = len(df_filtered)
-                print(f"✅ {cat_name}: Found {found_count}/{total} properties with nearby places")
+            # All categories counted in one column-wise reduction
+            found_counts = df_filtered[walking_cols].notna().sum()
+            total = len(df_filtered)
+            for cat_name, (prefix, nearest_col, walking_col, transit_col, calc_transit) in cat_meta.items():
+                print(f"✅ {cat_name}: Found {found_counts[walking_col]}/{total} properties with nearby places")
     
     # ================================================
     # UPDATE COMPLETION STATUS
     # ================================================
     
-    # Update status for all filtered properties
-    for idx, row in df_filtered.iterrows():
-        status = check_property_completion_status(row, place_categories)
-        df_filtered.at[idx, 'processing_status'] = status
-        df_valid.at[idx, 'processing_status'] = status
+    # Update status for all filtered properties (vectorized)
+    if len(df_filtered) > 0:
+        filtered_status = get_processing_status(get_completion_mask(df_filtered, place_categories))
+        df_filtered['processing_status'] = filtered_status
+        df_valid.loc[df_filtered.index, 'processing_status'] = filtered_status
     
-    completed = (df_filtered['processing_status'] == 'completed').sum()
-    incomplete = (df_filtered['processing_status'] == 'incomplete').sum()
+    status_counts = df_filtered['processing_status'].value_counts()
+    completed = status_counts.get('completed', 0)
+    incomplete = status_counts.get('incomplete', 0)
     print()
     print(f"📊 Status update: {completed} completed, {incomplete} incomplete")
     
@@ -1897,12 +3217,11 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     work_columns = ['distance_to_work_km', 'transit_time_work_minutes']
     
     category_columns = []
-    for cat_name, cat_config in place_categories.items():
-        prefix = cat_config['column_prefix']
-        category_columns.append(f'nearest_{prefix}')
-        category_columns.append(f'walking_time_{prefix}_minutes')
-        if cat_config.get('calculate_transit', False):
-            category_columns.append(f'transit_time_{prefix}_minutes')
+    for prefix, nearest_col, walking_col, transit_col, calc_transit in cat_meta.values():
+        category_columns.append(nearest_col)
+        category_columns.append(walking_col)
+        if calc_transit:
+            category_columns.append(transit_col)
     
     all_columns = base_columns + work_columns + category_columns
     
@@ -1918,18 +3237,17 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # ================================================
     
     # Add place category columns if they don't exist
-    for cat_name, cat_config in place_categories.items():
-        prefix = cat_config['column_prefix']
-        if f'nearest_{prefix}' not in df_valid.columns:
-            df_valid[f'nearest_{prefix}'] = None
-            df_valid[f'walking_time_{prefix}_minutes'] = None
-            if cat_config.get('calculate_transit', False):
-                df_valid[f'transit_time_{prefix}_minutes'] = None
-    
-    # Update df_valid with data from df_filtered (for place search results)
-    for col in df_filtered.columns:
-        if col in df_valid.columns:
-            df_valid.loc[df_filtered.index, col] = df_filtered[col]
+    for prefix, nearest_col, walking_col, transit_col, calc_transit in cat_meta.values():
+        if nearest_col not in df_valid.columns:
+            df_valid[nearest_col] = None
+            df_valid[walking_col] = None
+            if calc_transit:
+                df_valid[transit_col] = None
+    
+    # Update df_valid with data from df_filtered (for place search results) in one block write
+    shared_columns = df_filtered.columns.intersection(df_valid.columns, sort=False)
+    if len(df_filtered) > 0 and len(shared_columns) > 0:
+        df_valid.loc[df_filtered.index, shared_columns] = df_filtered[shared_columns]
     
     # Prepare df_valid columns in correct order
     final_columns_valid = [col for col in all_columns if col in df_valid.columns]
@@ -1938,8 +3256,12 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     df_valid = df_valid[final_columns_valid]
     
     # Track final statistics
-    completed = (df_valid['processing_status'] == 'completed').sum() if 'processing_status' in df_valid.columns else 0
-    incomplete = (df_valid['processing_status'] == 'incomplete').sum() if 'processing_status' in df_valid.columns else 0
+    if 'processing_status' in df_valid.columns:
+        status_counts = df_valid['processing_status'].value_counts()
+        completed = status_counts.get('completed', 0)
+        incomplete = status_counts.get('incomplete', 0)
+    else:
+        completed = incomplete = 0
     tracker.stats['step5_distance_calculation']['properties_processed'] = len(df_valid)
     tracker.stats['step5_distance_calculation']['properties_completed'] = completed
     tracker.stats['step5_distance_calculation']['properties_incomplete'] = incomplete
@@ -1950,7 +3272,7 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # ================================================
     # Ensure all prices are clean integers (remove 'kr' suffix, spaces, etc.)
     if 'price' in df_valid.columns:
-        df_valid['price'] = df_valid['price'].apply(clean_price)
+        df_valid['price'] = clean_price_series(df_valid['price'])
         print(f"🧹 Cleaned price column (removed 'kr' suffix and non-numeric characters)")
     
     # ================================================
@@ -1958,8 +3280,8 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # ================================================
     # This file contains ALL properties (completed + incomplete) for reference
     output_filename_complete = get_type_aware_filename('property_listings_complete', property_type, file_suffix)
-    output_file_complete = os.path.join(output_dir, output_filename_complete)
-    df_valid.to_csv(output_file_complete, index=False, encoding='utf-8')
+    output_file_complete = output_path / output_filename_complete
+    write_csv(df_valid, output_file_complete)
     print(f"💾 Saved ALL property listings to: {output_file_complete}")
     print(f"   Total properties: {len(df_valid)} (completed: {completed}, incomplete: {incomplete})")
     
@@ -1970,7 +3292,7 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     # For sales: Save all properties with coordinates and work distance (even if place data incomplete)
     # For rental: Save only fully completed properties (with all place data)
     output_filename_final = get_type_aware_filename('property_listings_with_distances', property_type, file_suffix)
-    output_file_final = os.path.join(output_dir, output_filename_final)
+    output_file_final = output_path / output_filename_final
     
     if property_type == 'sales':
         # For sales: Save all properties that have been geocoded (successfully processed from emails)
@@ -1985,41 +3307,6 @@ def calculate_distances_and_filter(args, input_csv_path=None):
                 (df_valid['longitude'].notna())
             ].copy()
         
-        # #region agent log
-        target_finnkodes = ['437802416', '442148776', '435383650']
-        for target_fk in target_finnkodes:
-            if 'link' in df_to_save.columns:
-                matching = df_to_save[df_to_save['link'].str.contains(target_fk, na=False)]
-                if len(matching) > 0:
-                    import json
-                    try:
-                        with open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a') as f:
-                            f.write(json.dumps({
-                                'sessionId': 'debug-session',
-                                'runId': 'run1',
-                                'hypothesisId': 'D',
-                                'location': 'distance_calculator.py:1582',
-                                'message': f'Property {target_fk} in df_to_save',
-                                'data': {'finnkode': target_fk, 'geocode_status': matching.iloc[0].get('geocode_status'), 'has_distance': pd.notna(matching.iloc[0].get('distance_to_work_km'))},
-                                'timestamp': int(time.time() * 1000)
-                            }) + '\n')
-                    except: pass
-                else:
-                    import json
-                    try:
-                        with open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a') as f:
-                            f.write(json.dumps({
-                                'sessionId': 'debug-session',
-                                'runId': 'run1',
-                                'hypothesisId': 'D',
-                                'location': 'distance_calculator.py:1582',
-                                'message': f'Property {target_fk} NOT in df_to_save',
-                                'data': {'finnkode': target_fk, 'df_to_save_count': len(df_to_save), 'df_valid_count': len(df_valid)},
-                                'timestamp': int(time.time() * 1000)
-                            }) + '\n')
-                    except: pass
-        # #endregion
-        
         print(f"💾 Saving PROCESSED sales properties (all geocoded properties from emails) to: {output_file_final}")
         print(f"   Processed sales properties: {len(df_to_save)}")
         if len(df_to_save) > 0:
@@ -2032,7 +3319,8 @@ def calculate_distances_and_filter(args, input_csv_path=None):
         print(f"   Completed rental properties: {len(df_to_save)}")
     
     # Save processed properties to property_listings_with_distances.csv
-    df_to_save.to_csv(output_file_final, index=False, encoding='utf-8')
+    write_csv(df_to_save, output_file_final)
+    write_columnar_copy(df_to_save, output_file_final)
     print(f"✅ Saved {len(df_to_save)} properties to: {output_file_final}")
     
     # Print API usage summary
@@ -2069,13 +3357,13 @@ def calculate_distances_and_filter(args, input_csv_path=None):
     logger.info(f"Distance Matrix API: {final_stats['distance_matrix_calls_in_window']} calls in current window")
     logger.info(f"Places API: {final_stats['places_calls_in_window']} calls in current window")
     
-    total_execution_time = time.time() - script_start_time
+    total_execution_time = time.perf_counter() - script_start_time
     total_minutes = int(total_execution_time // 60)
     total_seconds = int(total_execution_time % 60)
     logger.info(f"Total execution time: {total_minutes} minutes {total_seconds} seconds ({total_execution_time:.1f} seconds)")
     logger.info("="*70)
     
-    return output_file_final
+    return str(output_file_final)
 
 
 # For standalone execution
@@ -4,14 +4,132 @@
 
 import os
 import smtplib
+import atexit
+import base64
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
 from dotenv import load_dotenv
 from pathlib import Path
 from datetime import datetime
 
+# Try to import pyarrow - count_properties falls back to pandas if not installed
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# ============================================
+# SMTP CONNECTION REUSE
+# ============================================
+
+# Gmail's SMTP server
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 587
+
+# Gmail limits how many messages one SMTP session may send; a reused connection is
+# replaced by a fresh one after this many messages
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+
+# Authenticated connections kept open for the rest of the run, keyed by (host, port, user),
+# so a rental + sales run pays for the TLS handshake and login once instead of per email
+_smtp_connections = {}
+_smtp_messages_sent = {}  # (host, port, user) -> messages sent on the cached connection
+
+
+def _get_smtp_connection(host, port, user, password):
+    """
+    Return an authenticated SMTP connection, reusing the one from an earlier email if it's still alive.
+    
+    First Principles:
+    - Opening a connection costs a TCP connect, a STARTTLS handshake and a LOGIN
+    - A cached connection is checked with NOOP (reply code 250 = still usable) before reuse
+    - A dead or missing connection, or one that has already sent
+      SMTP_MAX_MESSAGES_PER_CONNECTION messages, is replaced by a fresh one
+    
+    Args:
+        host (str): SMTP server host
+        port (int): SMTP server port
+        user (str): Login user (sender email)
+        password (str): Login password (Gmail App Password)
+    
+    Returns:
+        smtplib.SMTP: Connected, logged-in server
+    """
+    key = (host, port, user)
+    server = _smtp_connections.get(key)
+    if server is not None and _smtp_messages_sent.get(key, 0) >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+        print(f"   Connection has sent {_smtp_messages_sent[key]} messages, reconnecting...")
+        _discard_smtp_connection(key)
+        server = None
+    if server is not None:
+        try:
+            code, _ = server.noop()
+            if code == 250:
+                print(f"   Reusing open connection to {host}:{port}...")
+                return server
+        except smtplib.SMTPException:
+            pass
+        _discard_smtp_connection(key)
+    
+    print(f"   Connecting to {host}:{port}...")
+    server = smtplib.SMTP(host, port, timeout=30)
+    server.set_debuglevel(0)  # Set to 1 for verbose SMTP output
+    
+    try:
+        print("   Starting TLS encryption...")
+        server.starttls()
+        
+        print("   Logging in...")
+        server.login(user, password)
+    except Exception:
+        server.close()
+        raise
+    
+    _smtp_connections[key] = server
+    _smtp_messages_sent[key] = 0
+    return server
+
+
+def _discard_smtp_connection(key):
+    """
+    Drop a cached SMTP connection and close it, ignoring errors from an already dead socket.
+    
+    Args:
+        key (tuple): (host, port, user) cache key
+    """
+    server = _smtp_connections.pop(key, None)
+    _smtp_messages_sent.pop(key, None)
+    if server is None:
+        return
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def _close_smtp_connections():
+    """Close every cached SMTP connection when the process exits."""
+    for key in list(_smtp_connections):
+        _discard_smtp_connection(key)
+
+
+atexit.register(_close_smtp_connections)
+
+
+# Base64-encoded attachment payloads, keyed by (absolute path, mtime in ns, size), so the
+# same unchanged file attached to another email isn't read and encoded again
+_attachment_cache = {}
+
+# Attachments are read and base64-encoded in chunks of this many bytes. A multiple of 57
+# (the input size of one 76-character base64 line) so chunks encode to whole lines and
+# the joined result is identical to encoding the whole file at once
+ATTACHMENT_CHUNK_BYTES = 57 * 1024
+
 
 def send_property_results_notification(
     csv_with_distances_path,
@@ -28,7 +146,8 @@ def send_property_results_notification(
     - MIMEMultipart: Creates an email that can have multiple parts (text + attachments)
     - MIMEBase: Base class for email attachments
     - We attach files by reading them, encoding them, and adding to the email
-    - smtplib connects to Gmail's SMTP server to send the email
+    - smtplib connects to Gmail's SMTP server to send the email; the logged-in
+      connection is kept open and reused by the next email in the same run
     
     Args:
         csv_with_distances_path (str): Path to property_listings_with_distances.csv
@@ -106,16 +225,7 @@ def send_property_results_notification(
     count_all = "N/A"
     count_completed = "N/A"
     try:
-        import pandas as pd
-        df_all = pd.read_csv(csv_with_distances_path)
-        count_all = len(df_all)
-        
-        # Count completed properties if column exists
-        if 'processing_status' in df_all.columns:
-            count_completed = len(df_all[df_all['processing_status'] == 'completed'])
-        else:
-            count_completed = count_all  # Assume all are completed if no status column
-            
+        count_all, count_completed = count_properties(csv_with_distances_path)
         print(f"   Properties: {count_all} (completed: {count_completed})")
     except Exception as e:
         print(f"⚠️  Warning: Could not read CSV file to count properties: {e}")
@@ -201,30 +311,23 @@ def send_property_results_notification(
     # ============================================
     print("\n📤 Sending email...")
     
+    smtp_key = (SMTP_HOST, SMTP_PORT, sender_email)
     try:
-        # Connect to Gmail's SMTP server
-        print("   Connecting to smtp.gmail.com:587...")
-        server = smtplib.SMTP('smtp.gmail.com', 587, timeout=30)
-        server.set_debuglevel(0)  # Set to 1 for verbose SMTP output
-        
-        print("   Starting TLS encryption...")
-        server.starttls()
-        
-        print("   Logging in...")
-        server.login(sender_email, sender_password)
+        # Connect to Gmail's SMTP server (or reuse the connection from an earlier email)
+        server = _get_smtp_connection(SMTP_HOST, SMTP_PORT, sender_email, sender_password)
         
         print("   Sending message...")
         text = msg.as_string()
         server.sendmail(sender_email, recipient_email, text)
+        _smtp_messages_sent[smtp_key] += 1
         
-        print("   Closing connection...")
-        server.quit()
-        
+        # The connection stays open for the next email; it is closed at exit
         print(f"\n✅ Email sent successfully to {recipient_email}!")
         print("="*70)
         return True
         
     except smtplib.SMTPAuthenticationError as e:
+        _discard_smtp_connection(smtp_key)
         print(f"\n❌ Error: Authentication failed")
         print(f"   Details: {e}")
         print("   Possible causes:")
@@ -238,23 +341,27 @@ def send_property_results_notification(
         print("="*70)
         return False
     except smtplib.SMTPConnectError as e:
+        _discard_smtp_connection(smtp_key)
         print(f"\n❌ Error: Could not connect to SMTP server")
         print(f"   Details: {e}")
         print("   Check your internet connection and firewall settings")
         print("="*70)
         return False
     except smtplib.SMTPServerDisconnected as e:
+        _discard_smtp_connection(smtp_key)
         print(f"\n❌ Error: Server disconnected unexpectedly")
         print(f"   Details: {e}")
         print("="*70)
         return False
     except TimeoutError as e:
+        _discard_smtp_connection(smtp_key)
         print(f"\n❌ Error: Connection timed out")
         print(f"   Details: {e}")
         print("   Check your internet connection")
         print("="*70)
         return False
     except Exception as e:
+        _discard_smtp_connection(smtp_key)
         print(f"\n❌ Error sending email: {type(e).__name__}: {e}")
         import traceback
         traceback.print_exc()
@@ -262,16 +369,69 @@ def send_property_results_notification(
         return False
 
 
+def count_properties(csv_path):
+    """
+    Count all properties and completed properties in a results CSV.
+    
+    First Principles:
+    - Only two numbers are needed, so only one column is parsed: processing_status,
+      instead of building the whole wide DataFrame
+    - With pyarrow installed, that column is read by its multi-threaded columnar CSV
+      reader and counted with pyarrow.compute; otherwise pandas reads it as a category
+    - Rows are still counted by the CSV parser, not by counting lines, because quoted
+      fields (titles, addresses) can contain line breaks
+    
+    Args:
+        csv_path (str): Path to the CSV file
+    
+    Returns:
+        tuple: (count_all, count_completed) - if the file has no processing_status
+            column, every property counts as completed
+    """
+    import pandas as pd
+    
+    header = pd.read_csv(csv_path, nrows=0).columns
+    
+    if PYARROW_AVAILABLE:
+        include_columns = ['processing_status'] if 'processing_status' in header else [header[0]]
+        try:
+            table = pacsv.read_csv(
+                csv_path,
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=include_columns,
+                    column_types={col: pa.string() for col in include_columns}
+                )
+            )
+        except pa.ArrowInvalid:
+            pass  # Something pyarrow's parser rejects - count it with pandas below
+        else:
+            if 'processing_status' not in header:
+                return table.num_rows, table.num_rows  # Assume all are completed if no status column
+            count_completed = pc.sum(pc.equal(table['processing_status'], 'completed')).as_py()
+            return table.num_rows, count_completed or 0
+    
+    if 'processing_status' not in header:
+        count_all = len(pd.read_csv(csv_path, usecols=[0]))
+        return count_all, count_all  # Assume all are completed if no status column
+    
+    statuses = pd.read_csv(csv_path, usecols=['processing_status'], dtype='category')['processing_status']
+    return len(statuses), int((statuses == 'completed').sum())
+
+
 def attach_file(msg, file_path, filename=None):
     """
     Attach a file to an email message.
     
     First Principles:
-    - We read the file in binary mode ('rb')
+    - We read the file in binary mode ('rb'), in chunks
     - Create a MIMEBase object to represent the attachment
-    - Encode it using base64 encoding (standard for email attachments)
+    - Encode it using base64 encoding (standard for email attachments) chunk by chunk,
+      so the raw file bytes are never held in memory next to the full encoded text
     - Set the appropriate headers so email clients know it's an attachment
     - Add it to the email message
+    - The encoded payload is cached by path, modification time and size; attaching
+      the same unchanged file again reuses it instead of re-reading and re-encoding
     
     Args:
         msg: MIMEMultipart message object
@@ -281,15 +441,25 @@ def attach_file(msg, file_path, filename=None):
     if filename is None:
         filename = os.path.basename(file_path)
     
-    # Open the file in binary mode
-    with open(file_path, 'rb') as attachment:
-        # Create a MIMEBase object
-        part = MIMEBase('application', 'octet-stream')
-        # Read the file content
-        part.set_payload(attachment.read())
-    
-    # Encode the attachment in base64
-    encoders.encode_base64(part)
+    # Create a MIMEBase object
+    part = MIMEBase('application', 'octet-stream')
+    
+    file_stat = os.stat(file_path)
+    cache_key = (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size)
+    cached_payload = _attachment_cache.get(cache_key)
+    
+    if cached_payload is None:
+        # Open the file in binary mode and encode it in base64 one chunk at a time
+        encoded_chunks = []
+        with open(file_path, 'rb') as attachment:
+            for chunk in iter(lambda: attachment.read(ATTACHMENT_CHUNK_BYTES), b''):
+                encoded_chunks.append(base64.encodebytes(chunk).decode('ascii'))
+        cached_payload = ''.join(encoded_chunks)
+        _attachment_cache[cache_key] = cached_payload
+    
+    # The payload is already base64 text (reused as-is for an unchanged file)
+    part.set_payload(cached_payload)
+    part['Content-Transfer-Encoding'] = 'base64'
     
     # Add header to indicate it's an attachment
     part.add_header(
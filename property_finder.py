@@ -144,9 +144,6 @@ def run_pipeline(property_type: str, type_config: dict, args: argparse.Namespace
     }
     
     try:
-        # #region agent log
-        import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"B","location":"property_finder.py:146","message":"run_pipeline entry","data":{"property_type":property_type,"type_output_dir":type_output_dir},"timestamp":int(__import__('time').time()*1000)})+'\n')
-        # #endregion
         # Track output paths between steps
         main_csv = None
         coords_csv = None
@@ -158,9 +155,6 @@ def run_pipeline(property_type: str, type_config: dict, args: argparse.Namespace
         # ============================================
         if not type_args.skip_email_fetch:
             print(f"[{property_type.upper()}] Step 1: Fetching and parsing emails...")
-            # #region agent log
-            import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"B","location":"property_finder.py:157","message":"Before fetch_and_parse_emails_workflow","data":{"property_type":property_type,"type_args_property_type":getattr(type_args,'property_type','NOT_SET')},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
             try:
                 main_csv, ambiguous_csv = fetch_and_parse_emails_workflow(type_args)
                 
@@ -175,9 +169,6 @@ def run_pipeline(property_type: str, type_config: dict, args: argparse.Namespace
                     result['error'] = 'No new properties to process - all already processed'
                     return result
             except Exception as e:
-                # #region agent log
-                import json, traceback; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"B","location":"property_finder.py:171","message":"Step 1 exception caught","data":{"property_type":property_type,"error":str(e),"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000)})+'\n')
-                # #endregion
                 print(f"[{property_type.upper()}] ❌ Error in Step 1: {e}")
                 import traceback
                 traceback.print_exc()
@@ -209,19 +200,10 @@ def run_pipeline(property_type: str, type_config: dict, args: argparse.Namespace
         # ============================================
         if not type_args.skip_geocoding:
             print(f"[{property_type.upper()}] Step 2: Geocoding addresses...")
-            # #region agent log
-            import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"E","location":"property_finder.py:199","message":"Before Step 2 geocode","data":{"property_type":property_type,"main_csv":main_csv},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
             try:
                 coords_csv = geocode_properties(type_args, input_csv_path=main_csv)
                 print(f"[{property_type.upper()}] ✅ Step 2 complete: Coordinates saved to: {coords_csv}")
-                # #region agent log
-                import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"E","location":"property_finder.py:204","message":"Step 2 geocode success","data":{"property_type":property_type,"coords_csv":coords_csv},"timestamp":int(__import__('time').time()*1000)})+'\n')
-                # #endregion
             except Exception as e:
-                # #region agent log
-                import json, traceback; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"E","location":"property_finder.py:207","message":"Step 2 geocode exception","data":{"property_type":property_type,"error":str(e),"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000)})+'\n')
-                # #endregion
                 print(f"[{property_type.upper()}] ❌ Error in Step 2: {e}")
                 import traceback
                 traceback.print_exc()
@@ -251,19 +233,10 @@ def run_pipeline(property_type: str, type_config: dict, args: argparse.Namespace
         # STEP 3: CALCULATE DISTANCES AND FILTER
         # ============================================
         print(f"[{property_type.upper()}] Step 3: Calculating distances and filtering...")
-        # #region agent log
-        import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"E","location":"property_finder.py:232","message":"Before Step 3 distance calc","data":{"property_type":property_type,"coords_csv":coords_csv},"timestamp":int(__import__('time').time()*1000)})+'\n')
-        # #endregion
         try:
             result_csv = calculate_distances_and_filter(type_args, input_csv_path=coords_csv)
             print(f"[{property_type.upper()}] ✅ Step 3 complete: Final results saved to: {result_csv}")
-            # #region agent log
-            import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"E","location":"property_finder.py:236","message":"Step 3 distance calc success","data":{"property_type":property_type,"result_csv":result_csv},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
         except Exception as e:
-            # #region agent log
-            import json, traceback; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"E","location":"property_finder.py:238","message":"Step 3 distance calc exception","data":{"property_type":property_type,"error":str(e),"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
             print(f"[{property_type.upper()}] ❌ Error in Step 3: {e}")
             import traceback
             traceback.print_exc()
@@ -335,9 +308,6 @@ def run_pipeline(property_type: str, type_config: dict, args: argparse.Namespace
         return result
         
     except Exception as e:
-            # #region agent log
-            import json, traceback; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"B","location":"property_finder.py:306","message":"Unexpected pipeline exception","data":{"property_type":property_type,"error":str(e),"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000)})+'\n')
-            # #endregion
             print(f"[{property_type.upper()}] ❌ Unexpected error in pipeline: {e}")
             import traceback
             traceback.print_exc()
@@ -371,16 +341,10 @@ def main():
     # DETERMINE ENABLED TYPES
     # ============================================
     enabled_types = []
-    # #region agent log
-    import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"F","location":"property_finder.py:372","message":"Checking enabled types","data":{"rental_config_exists":bool(rental_config),"rental_enabled":rental_config.get('enabled', True) if rental_config else None,"sales_config_exists":bool(sales_config),"sales_enabled":sales_config.get('enabled', False) if sales_config else None},"timestamp":int(__import__('time').time()*1000)})+'\n')
-    # #endregion
     if rental_config and rental_config.get('enabled', True):  # Default True for backward compat
         enabled_types.append('rental')
     if sales_config and sales_config.get('enabled', False):
         enabled_types.append('sales')
-    # #region agent log
-    import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"F","location":"property_finder.py:378","message":"Enabled types determined","data":{"enabled_types":enabled_types},"timestamp":int(__import__('time').time()*1000)})+'\n')
-    # #endregion
     
     if not enabled_types:
         print("⚠️  No property types enabled. Check config.yaml")
@@ -412,9 +376,6 @@ def main():
     all_results = []
     
     for property_type in enabled_types:
-        # #region agent log
-        import json; open('/Users/isuruwarakagoda/Projects/.cursor/debug.log', 'a').write(json.dumps({"sessionId":"debug-session","runId":"run1","hypothesisId":"F","location":"property_finder.py:407","message":"Starting pipeline for property type","data":{"property_type":property_type,"enabled_types":enabled_types},"timestamp":int(__import__('time').time()*1000)})+'\n')
-        # #endregion
         print("\n" + "="*70)
         print(f"PROCESSING {property_type.upper()} PROPERTIES")
         print("="*70)
@@ -545,6 +506,12 @@ Note: Edit config.py to change default settings permanently.
         help=f"Number of properties to process in test mode (default: {CONFIG['test_limit']} from config.py)"
     )
     
+    parser.add_argument(
+        '--run-smoke-test',
+        action='store_true',
+        help='Make one test Distance Matrix call before processing (uses one API call per property type)'
+    )
+    
     # ============================================
     # SKIP OPTIONS
     # ============================================